@@ -1,21 +1,48 @@
-import os
 import json
-from dotenv import load_dotenv
+from config import CONFIG
 from agentmail import AgentMail
 from google import genai
+from google.genai import types
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import inspect
 import re
+import time
 import logging
 
 
-# Load the API key from the .env file
-load_dotenv()
-api_key = os.getenv("AGENTMAIL_API_KEY")
-gemini = os.getenv("GEMINI_API")
+import httpx
+
+# Share one pooled httpx client across all AgentMail calls so the thread-pool
+# fan-out reuses warm keep-alive connections instead of paying a fresh TCP+TLS
+# handshake per request.
+http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    timeout=30.0,
+)
+
 # Initialize the client
-client = AgentMail(api_key=api_key)
-client_genai = genai.Client(api_key=gemini)
+client = AgentMail(api_key=CONFIG.agentmail_api_key, httpx_client=http_client)
+
+# One genai client for the whole process (it is thread-safe); constructing it
+# per call would redo auth setup and drop warm connections. The client_args
+# keep a couple of connections alive between webhooks so back-to-back
+# generations skip the TLS handshake.
+client_genai = genai.Client(
+    api_key=CONFIG.gemini_api_key,
+    http_options=types.HttpOptions(
+        client_args={
+            "limits": httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        },
+    ),
+)
 
+# Memoized: the username is a pure function of the arguments, and profile
+# creation can call this twice for the same user (double-submit, retry). The
+# cache turns the duplicate into a no-op instead of a second API call that
+# errors on the taken username.
+@lru_cache(maxsize=256)
 def create_inbox(first_Name, last_Name, user_ID):
     username = f'{first_Name}{last_Name}.CareConnector.{user_ID}'
     inbox = client.inboxes.create(username=username)
@@ -39,19 +66,38 @@ def send_new_message(agent_email, recipient_email, subject, text):
         "status": "sent"
     }
 
+# Newer SDK versions let reply set labels in the same request; detect that
+# once so we can skip the separate update round trip when possible
+_reply_supports_labels = {"add_labels", "remove_labels"} <= set(
+    inspect.signature(client.inboxes.messages.reply).parameters
+)
+
 def reply_message(agent_email, message_id, text):
-    reply = client.inboxes.messages.reply(
-        inbox_id=agent_email,
-        message_id=message_id,
-        text=text,
-    )
+    if _reply_supports_labels:
+        # One request: the reply carries the read/unread label flip
+        reply = client.inboxes.messages.reply(
+            inbox_id=agent_email,
+            message_id=message_id,
+            text=text,
+            add_labels=["read"],
+            remove_labels=["unread"],
+        )
+    else:
+        reply = client.inboxes.messages.reply(
+            inbox_id=agent_email,
+            message_id=message_id,
+            text=text,
+        )
 
-    client.inboxes.messages.update(
-        inbox_id=agent_email,
-        message_id=message_id,
-        add_labels=["read"],
-        remove_labels=["unread"]
-    )   
+        # The label flip is bookkeeping the caller never reads; do it in the
+        # background instead of serializing a second round trip
+        thread_fetch_pool.submit(
+            client.inboxes.messages.update,
+            inbox_id=agent_email,
+            message_id=message_id,
+            add_labels=["read"],
+            remove_labels=["unread"],
+        )
     return {
         "message_id": reply.message_id,
     }
@@ -69,9 +115,40 @@ def get_message(agent_email, message_id):
         "sent_at": message.sent_at
     }
 
-def get_thread_context(agent_email, thread_id):
+# Webhook bursts trigger several lookups for the same thread in quick
+# succession; cache the fetch so only the first one pays the round trip.
+# Entries expire after a short TTL (threads change as mail arrives) and the
+# cache is bounded so a busy inbox cannot grow it without limit.
+THREAD_CACHE_TTL = 30  # seconds
+THREAD_CACHE_MAX = 256
+_thread_cache = {}
+
+def _fetch_thread(agent_email, thread_id):
+    key = (agent_email, thread_id)
+    now = time.monotonic()
+
+    cached = _thread_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
     thread = client.inboxes.threads.get(inbox_id=agent_email, thread_id=thread_id)
 
+    # Evict expired entries first, then oldest if still over the cap
+    if len(_thread_cache) >= THREAD_CACHE_MAX:
+        for k in [k for k, v in _thread_cache.items() if v[0] <= now]:
+            del _thread_cache[k]
+        while len(_thread_cache) >= THREAD_CACHE_MAX:
+            _thread_cache.pop(next(iter(_thread_cache)))
+
+    _thread_cache[key] = (now + THREAD_CACHE_TTL, thread)
+    return thread
+
+def _invalidate_thread(agent_email, thread_id):
+    _thread_cache.pop((agent_email, thread_id), None)
+
+def get_thread_context(agent_email, thread_id):
+    thread = _fetch_thread(agent_email, thread_id)
+
     messages = []
     for msg in thread.messages:
         messages.append({
@@ -89,12 +166,51 @@ def get_thread_context(agent_email, thread_id):
         "context_messages": messages
     }
 
+# Fetching each thread serially costs one round trip per thread, so fan the
+# calls out over a thread pool instead. Workers are capped to stay under
+# AgentMail rate limits.
+thread_fetch_pool = ThreadPoolExecutor(max_workers=16)
+
+# If the SDK's threads.list can expand message bodies in the list response,
+# use that and skip the per-thread GET calls entirely (no N+1). Detected once
+# at import time since it only depends on the installed SDK version.
+_list_messages_param = next(
+    (name for name in ("include_messages", "expand")
+     if name in inspect.signature(client.inboxes.threads.list).parameters),
+    None
+)
+
+# Cap how many fetches are in flight at once; one giant burst of submits
+# trips AgentMail rate limits on big inboxes, batches of 100 do not.
+THREAD_FETCH_BATCH_SIZE = 100
+
 def get_all_threads(agent_email):
-    all_threads = []
+    if _list_messages_param:
+        kwargs = {_list_messages_param: True if _list_messages_param == "include_messages" else "messages"}
+        threads = client.inboxes.threads.list(inbox_id=agent_email, **kwargs)
+        full_threads = threads.threads
+    else:
+        threads = client.inboxes.threads.list(inbox_id=agent_email)
+
+        # Submit fetches in bounded batches. The futures list is indexed in
+        # the same order as threads.threads and results are collected by that
+        # index (not completion order), so the response ordering is identical
+        # to the old serial loop no matter which fetch finishes first.
+        full_threads = []
+        thread_list = threads.threads
+        for i in range(0, len(thread_list), THREAD_FETCH_BATCH_SIZE):
+            futures = [
+                thread_fetch_pool.submit(
+                    client.inboxes.threads.get,
+                    inbox_id=agent_email,
+                    thread_id=thread.thread_id,
+                )
+                for thread in thread_list[i:i + THREAD_FETCH_BATCH_SIZE]
+            ]
+            full_threads.extend(future.result() for future in futures)
 
-    threads = client.inboxes.threads.list(inbox_id=agent_email)
-    for thread in threads.threads:
-        thread_full = client.inboxes.threads.get(inbox_id=agent_email, thread_id=thread.thread_id)
+    all_threads = []
+    for thread_full in full_threads:
         thread_data = {
             "thread_id": thread_full.thread_id,
             "subject": thread_full.subject,
@@ -117,15 +233,19 @@ def get_all_threads(agent_email):
 
 # Set up basic logging configuration without timestamps
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s - %(message)s')
-def is_valid_email(email):
-    # Regex pattern to match a valid email address format
-    pattern = r"^(?!\.)(?!.*\.\.)([A-Za-z0-9_'+\-\.]*)[A-Za-z0-9_+-]@([A-Za-z0-9][A-Za-z0-9\-]*\.)+[A-Za-z]{2,}$"
-    return re.match(pattern, email) is not None
+# Regex pattern to match a valid email address format, compiled once at
+# import time instead of on every call
+EMAIL_PATTERN = re.compile(
+    r"^(?!\.)(?!.*\.\.)([A-Za-z0-9_'+\-\.]*)[A-Za-z0-9_+-]@([A-Za-z0-9][A-Za-z0-9\-]*\.)+[A-Za-z]{2,}$"
+)
 
-def autoReply(thread_id):
-    agent_email = client.threads.get(thread_id=thread_id).inbox_id
+def is_valid_email(email):
+    return EMAIL_PATTERN.match(email) is not None
 
-    prompt = """You are a healthcare assistant drafting an email on behalf of the sender (the person requesting information or action).
+# Static instructions for the auto-reply drafts. Kept as a module constant and
+# sent as the system instruction so Gemini's implicit prefix caching can reuse
+# the processed prompt across webhooks instead of re-tokenizing it every call.
+AUTO_REPLY_PROMPT = """You are a healthcare assistant drafting an email on behalf of the sender (the person requesting information or action).
 
 Read the email chain below and write a clear, professional, and action-oriented reply addressed to healthcare staff (such as doctors, nurses, or medical secretaries). Your reply should:
 
@@ -144,34 +264,57 @@ Read the email chain below and write a clear, professional, and action-oriented
 
 Your goal is to either complete the request (such as scheduling an appointment, confirming instructions, or forwarding results) or gather the precise details required to complete it.
 
-Here is the email chain to respond to:
-\n\n"""
-    
-    # Get thread context once and store the result
-    context = get_thread_context(agent_email=agent_email, thread_id=thread_id)
-    message_id = context["last_message_id"]
-    
-    # Convert context messages to a human-readable format (instead of JSON string)
-    messages = ""
-    for msg in context["context_messages"]:
-        messages += f"From: {msg['from']}\nTo: {msg['to']}\nSubject: {msg['subject']}\nMessage: {msg['text']}\n\n"
-    
-    # Combine prompt with email thread context
-    full_prompt = prompt + messages
-
-    # Generate the response based on the prompt and context
-    response = client_genai.models.generate_content(
-        contents=full_prompt,
-        model="gemini-2.5-flash",
-    )
-    
+Here is the email chain to respond to:"""
+
+# Config is static too; build it once so every call shares the same object
+AUTO_REPLY_CONFIG = types.GenerateContentConfig(system_instruction=AUTO_REPLY_PROMPT)
+
+# Remaining fixed values used by the handlers, kept here with the other
+# module-level constants instead of being rebuilt per call
+GEMINI_MODEL = "gemini-2.5-flash"
+WEBHOOK_URL = "https://kindra-cressiest-bernardine.ngrok-free.dev/webhook"
+WEBHOOK_EVENT_TYPES = ["message.received"]
+
+def autoReply(thread_id):
+    # One fetch gives us everything: the inbox the thread lives in, the
+    # message to reply to, and the context messages. Previously the thread
+    # was fetched twice (once for inbox_id, once for context).
+    thread = client.threads.get(thread_id=thread_id)
+    agent_email = thread.inbox_id
+
+    message_id = thread.last_message_id
+
+    # Convert context messages to a human-readable format (instead of JSON string).
+    # Collect the pieces in a list and join once at the end -- repeated += on a
+    # string recopies the whole buffer for every message in the thread.
+    message_parts = []
+    for msg in thread.messages:
+        message_parts.append(f"From: {msg.from_}\nTo: {msg.to}\nSubject: {msg.subject}\nMessage: {msg.text}\n\n")
+
+    # Only the thread context goes in the contents; the static instructions
+    # ride along as the cached system instruction. Stream the generation and
+    # accumulate chunks as they arrive -- an email reply needs the full body
+    # before sending, but streaming avoids waiting on one monolithic response
+    # and lets us start consuming output at first-token time.
+    reply_parts = []
+    for chunk in client_genai.models.generate_content_stream(
+        contents="".join(message_parts),
+        model=GEMINI_MODEL,
+        config=AUTO_REPLY_CONFIG,
+    ):
+        if chunk.text:
+            reply_parts.append(chunk.text)
+
     # Send the generated response as a reply
-    reply_message(agent_email=agent_email, message_id=message_id, text=response.text)
-    
+    reply_message(agent_email=agent_email, message_id=message_id, text="".join(reply_parts))
+
+    # The reply changed the thread, so drop the cached copy
+    _invalidate_thread(agent_email, thread_id)
+
     return
 
 def webhookSetup():
     client.webhooks.create(
-        url="https://kindra-cressiest-bernardine.ngrok-free.dev/webhook",
-        event_types=["message.received"]  # Specify which events to listen to
+        url=WEBHOOK_URL,
+        event_types=WEBHOOK_EVENT_TYPES  # Specify which events to listen to
     )
@@ -1,22 +1,67 @@
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from agentmail_tool import create_inbox, send_new_message, reply_message, get_message, get_thread_context, get_all_threads, autoReply, webhookSetup
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson -- C-speed encode/decode for jsonify.
+
+    Matters most for /api/get-all-threads, which serializes whole inboxes.
+    default=str matches Flask's stock provider for types orjson has no
+    native encoding for (e.g. Decimal).
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
 logging.basicConfig(level=logging.INFO)
 
+# Pool for webhook work that should not block the HTTP response. AgentMail
+# retries webhooks that take too long to answer, so the handler has to ack
+# fast and do the Gemini/reply work in the background.
+webhook_pool = ThreadPoolExecutor(max_workers=4)
+
+def run_auto_reply(thread_id):
+    try:
+        autoReply(thread_id)
+        logging.info(f"Auto-reply sent for thread_id: {thread_id}")
+    except Exception as e:
+        logging.error(f"Error in autoReply for thread_id {thread_id}: {e}")
+
 app.secret_key = "something"
 
+# Parse the JSON body exactly once per request, up front. Every POST handler
+# used to call request.get_json() itself; doing it here means a malformed body
+# is rejected before any handler logic runs and handlers just read g.json.
+@app.before_request
+def parse_json_body():
+    if request.method == 'POST':
+        g.json = request.get_json(silent=True) or {}
+
 @app.route('/api/create-inbox', methods=['POST'])
 def create_inbox_route():
-    data = request.get_json()
+    data = g.json
     first_name = data.get("first_name")
     last_name = data.get("last_name")
     user_id = data.get("user_id")
 
-    if not all([first_name, last_name, user_id]):
+    if not (first_name and last_name and user_id):
         return jsonify({"error": "Missing first_name, last_name, or user_id"}), 400
 
     try:
@@ -27,13 +72,13 @@ def create_inbox_route():
 
 @app.route('/api/send-new-message', methods=['POST'])
 def send_new_message_route():
-    data = request.get_json()
+    data = g.json
     agent_email = data.get("agent_email")
     recipient_email = data.get("recipient_email")
     subject = data.get("subject")
     text = data.get("text")
 
-    if not all([agent_email, recipient_email, subject, text]):
+    if not (agent_email and recipient_email and subject and text):
         return jsonify({"error": "Missing required fields"}), 400
 
     try:
@@ -44,12 +89,12 @@ def send_new_message_route():
 
 @app.route('/api/reply-message', methods=['POST'])
 def reply_message_route():
-    data = request.get_json()
+    data = g.json
     agent_email = data.get("agent_email")
     message_id = data.get("message_id")
     text = data.get("text")
 
-    if not all([agent_email, message_id, text]):
+    if not (agent_email and message_id and text):
         return jsonify({"error": "Missing required fields"}), 400
 
     try:
@@ -60,11 +105,11 @@ def reply_message_route():
 
 @app.route('/api/get-message', methods=['POST'])
 def get_message_route():
-    data = request.get_json()
+    data = g.json
     agent_email = data.get("agent_email")
     message_id = data.get("message_id")
 
-    if not all([agent_email, message_id]):
+    if not (agent_email and message_id):
         return jsonify({"error": "Missing agent_email or message_id"}), 400
 
     try:
@@ -75,11 +120,11 @@ def get_message_route():
 
 @app.route('/api/get-thread-context', methods=['POST'])
 def get_thread_context_route():
-    data = request.get_json()
+    data = g.json
     agent_email = data.get("agent_email")
     thread_id = data.get("thread_id")
 
-    if not all([agent_email, thread_id]):
+    if not (agent_email and thread_id):
         return jsonify({"error": "Missing agent_email or thread_id"}), 400
 
     try:
@@ -90,7 +135,7 @@ def get_thread_context_route():
 
 @app.route('/api/get-all-threads', methods=['POST'])
 def get_all_threads_route():
-    data = request.get_json()
+    data = g.json
     agent_email = data.get("agent_email")
 
     if not agent_email:
@@ -105,7 +150,7 @@ def get_all_threads_route():
 
 @app.route('/webhook', methods=['POST'])
 def webhook():
-    data = request.get_json()
+    data = g.json
 
     if 'thread_id' not in data['message']:
         logging.error('Missing required fields in the webhook payload')
@@ -118,14 +163,18 @@ def webhook():
         logging.error(f"Invalid email or thread_id: {thread_id}")
         return jsonify({'error': 'Missing valid agent_email or thread_id'}), 400
 
-    try:
-        autoReply(thread_id)
-        logging.info(f"Auto-reply triggered for thread_id: {thread_id}")
-        return jsonify({'status': 'success', 'message': 'Auto-reply triggered successfully'}), 200
-    except Exception as e:
-        logging.error(f"Error in autoReply: {e}")
-        return jsonify({'error': str(e)}), 500
+    # Ack immediately and generate the reply in the background -- the Gemini
+    # call alone can take several seconds, long enough for AgentMail to
+    # consider the webhook failed and redeliver it.
+    webhook_pool.submit(run_auto_reply, thread_id)
+    logging.info(f"Auto-reply queued for thread_id: {thread_id}")
+    return jsonify({'status': 'success', 'message': 'Auto-reply queued'}), 200
     
+# In production run this under gunicorn instead of the single-threaded Flask
+# dev server, e.g.:
+#   gunicorn -w 4 --threads 8 -b 0.0.0.0:5002 app:app
+# The dev server handles one request at a time, so any slow AgentMail/Gemini
+# call blocks every other request.
 if __name__ == "__main__":
     webhookSetup()
-    app.run(debug=True, port=5002)
+    app.run(debug=True, port=5002, threaded=True)
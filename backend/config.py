@@ -0,0 +1,26 @@
+"""
+Process-wide configuration for the backend.
+
+The environment (and .env file) is read exactly once at import time and
+frozen into an immutable dataclass. Callers use CONFIG attributes instead of
+sprinkling os.getenv/load_dotenv side effects through request paths.
+"""
+
+import os
+from dataclasses import dataclass
+from dotenv import load_dotenv
+
+# One-time side effect: pull the .env file into the environment
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class Config:
+    agentmail_api_key: str
+    gemini_api_key: str
+
+
+CONFIG = Config(
+    agentmail_api_key=os.getenv("AGENTMAIL_API_KEY"),
+    gemini_api_key=os.getenv("GEMINI_API"),
+)
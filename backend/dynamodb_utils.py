@@ -14,36 +14,241 @@ Table Schema:
 """
 
 import boto3
+import botocore.config
 import os
+import pickle
+import random
+import threading
+import time
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
 from botocore.exceptions import ClientError
 from datetime import datetime
 import uuid
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging configuration is the application's job; a library calling
+# basicConfig would globally mutate the host app's logging setup
 logger = logging.getLogger(__name__)
 
+# Shared (de)serializers for the low-level client. The resource layer builds
+# fresh instances of these per call; reusing module-level ones skips that
+# allocation on every operation.
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+def _serialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a plain dict to DynamoDB AttributeValue format."""
+    return {k: _SERIALIZER.serialize(v) for k, v in item.items()}
+
+
+def _deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a DynamoDB AttributeValue dict back to plain Python values."""
+    return {k: _DESERIALIZER.deserialize(v) for k, v in item.items()}
+
+
+def _key(pk: str, sk: str) -> Dict[str, Any]:
+    """Build an AttributeValue key for the PK/SK pair."""
+    return {'PK': {'S': pk}, 'SK': {'S': sk}}
+
+
+# Metadata timestamps only need second resolution, so memoize the formatted
+# string per wall-clock second: bulk writes stamping thousands of rows call
+# this in a tight loop, and the datetime construction plus isoformat() are
+# the expensive part, not the time lookup.
+_TS_CACHE = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string, cached within the same second."""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.utcfromtimestamp(now).isoformat()
+    return _TS_CACHE[1]
+
+
+def _projection(attributes: List[str]) -> Dict[str, Any]:
+    """Build ProjectionExpression kwargs for an attribute list.
+
+    Every attribute goes through an #a{i} placeholder so names that collide
+    with DynamoDB reserved words (Name, Status, Timestamp, ...) just work.
+    """
+    names = {f'#a{i}': attr for i, attr in enumerate(attributes)}
+    return {
+        'ProjectionExpression': ', '.join(names),
+        'ExpressionAttributeNames': names,
+    }
+
+
+# One session and one tuned HTTP config for the whole process. Constructing a
+# fresh resource/client per DynamoDBUtils instance builds a new connection
+# pool each time, so concurrent workers churn TLS handshakes instead of
+# reusing warm connections.
+# Ceiling on UnprocessedItems retries before leftovers go back to the caller
+MAX_BATCH_RETRIES = 8
+
+_SESSION = boto3.session.Session()
+_CONFIG = botocore.config.Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=8)
+def _get_client(region_name: str):
+    """Shared low-level DynamoDB client for a region."""
+    return _SESSION.client('dynamodb', region_name=region_name, config=_CONFIG)
+
+
+@lru_cache(maxsize=8)
+def _get_table(table_name: str, region_name: str):
+    """Shared Table resource for a (table, region) pair."""
+    resource = _SESSION.resource('dynamodb', region_name=region_name, config=_CONFIG)
+    return resource
+
+class CacheBackend:
+    """Interface for an optional read-through cache in front of DynamoDB."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend on Redis/ElastiCache. Values are pickled whole items
+    (pickle rather than JSON because DynamoDB returns Decimal values)."""
+
+    def __init__(self, url: str = None, **redis_kwargs):
+        import redis  # optional dependency, only needed when caching is enabled
+        if url:
+            self._redis = redis.Redis.from_url(url, **redis_kwargs)
+        else:
+            self._redis = redis.Redis(**redis_kwargs)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self._redis.get(key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._redis.set(key, pickle.dumps(value), ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self._redis.delete(key)
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to cap the DynamoDB write rate."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1):
+        """Block until the requested number of tokens is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class DynamoDBUtils:
     """Utility class for DynamoDB operations."""
 
-    def __init__(self, table_name: str = None, region_name: str = None):
+    def __init__(self, table_name: str = None, region_name: str = None,
+                 writes_per_second: float = None,
+                 cache: CacheBackend = None, cache_ttl: int = 300,
+                 mutate_input: bool = False,
+                 use_dax: bool = False, dax_endpoint: str = None):
         """
         Initialize DynamoDB client and table resource.
 
         Args:
             table_name: Name of the DynamoDB table. If None, reads from environment or uses default.
             region_name: AWS region. If None, uses default from environment.
+            writes_per_second: Optional cap on batch write rate, for tables with
+                tight provisioned capacity. None disables rate limiting.
+            cache: Optional CacheBackend (e.g. RedisCacheBackend) used as a
+                read-through cache for get_item. None disables caching.
+            cache_ttl: Seconds a cached item stays valid.
+            mutate_input: Set metadata fields directly on the caller's dicts
+                in create_item/batch_write_items instead of copying each item.
+                Saves a full dict copy per row on bulk loads; only enable when
+                the caller does not reuse the dicts afterwards.
+            use_dax: Route calls through a DAX cluster client instead of the
+                plain DynamoDB client. Requires the amazondax package and a
+                dax_endpoint. DAX exposes the same client API, so all methods
+                work unchanged; hot reads come from the in-cluster cache.
+            dax_endpoint: DAX cluster endpoint, e.g. 'my-dax.xxxx.clustercfg.dax...:8111'.
         """
         self.region_name = region_name or os.getenv('AWS_DEFAULT_REGION', 'us-east-2')
         self.table_name = table_name or os.getenv('PATIENTS_TABLE_NAME', 'careconnector-main')
 
-        # Initialize DynamoDB resources
-        self.dynamodb = boto3.resource('dynamodb', region_name=self.region_name)
-        self.table = self.dynamodb.Table(self.table_name)
+        if use_dax and not dax_endpoint:
+            raise ValueError("use_dax=True requires a dax_endpoint")
+        self._use_dax = use_dax
+        self._dax_endpoint = dax_endpoint
+
+        self._write_limiter = TokenBucket(writes_per_second) if writes_per_second else None
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.mutate_input = mutate_input
+
+        # UpdateExpression templates keyed by the set of updated attributes.
+        # Services update the same few field combinations over and over, so
+        # the expression string and name map can be built once per shape.
+        self._update_tpl_cache: Dict[frozenset, tuple] = {}
+
+        logger.info("Initialized DynamoDB utils for table: %s in region: %s", self.table_name, self.region_name)
+
+    # Client and resource handles are built lazily on first use. Constructing
+    # a DynamoDBUtils no longer touches the network or loads service models,
+    # which matters for code paths (and Lambda cold starts) that instantiate
+    # the helper but only exercise one of the handles.
+
+    @cached_property
+    def client(self):
+        """Low-level client: skips the resource layer's per-call marshalling
+        objects; we (de)serialize once with the shared module-level helpers.
+        Comes from the process-wide cached session so every DynamoDBUtils
+        instance shares one connection pool."""
+        if self._use_dax:
+            # Optional dependency; DAX speaks the same client API over a
+            # binary protocol with an in-cluster item cache
+            from amazondax import AmazonDaxClient
+            return AmazonDaxClient(
+                region_name=self.region_name,
+                endpoints=[self._dax_endpoint]
+            )
+        return _get_client(self.region_name)
+
+    @cached_property
+    def dynamodb(self):
+        """Resource object kept for back-compat."""
+        return _get_table(self.table_name, self.region_name)
 
-        logger.info(f"Initialized DynamoDB utils for table: {self.table_name} in region: {self.region_name}")
+    @cached_property
+    def table(self):
+        """Table resource kept for back-compat."""
+        return self.dynamodb.Table(self.table_name)
 
     def create_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -62,21 +267,22 @@ class DynamoDBUtils:
         if 'PK' not in item or 'SK' not in item:
             raise ValueError("Item must contain both 'PK' and 'SK' keys")
 
-        # Add metadata
-        timestamp = datetime.utcnow().isoformat()
-        item_with_metadata = {
-            **item,
-            'CreatedAt': timestamp,
-            'UpdatedAt': timestamp,
-            'ItemId': str(uuid.uuid4())
-        }
+        # Add metadata. dict.copy() is a single C-level copy, cheaper than
+        # rebuilding the dict with {**item, ...}; with mutate_input the copy
+        # is skipped entirely.
+        timestamp = _now_iso()
+        item_with_metadata = item if self.mutate_input else item.copy()
+        item_with_metadata['CreatedAt'] = timestamp
+        item_with_metadata['UpdatedAt'] = timestamp
+        item_with_metadata['ItemId'] = str(uuid.uuid4())
 
         try:
-            response = self.table.put_item(
-                Item=item_with_metadata,
+            response = self.client.put_item(
+                TableName=self.table_name,
+                Item=_serialize_item(item_with_metadata),
                 ConditionExpression='attribute_not_exists(PK) AND attribute_not_exists(SK)'
             )
-            logger.info(f"Created item with PK: {item['PK']}, SK: {item['SK']}")
+            logger.info("Created item with PK: %s, SK: %s", item['PK'], item['SK'])
             return {
                 'item': item_with_metadata,
                 'response_metadata': response.get('ResponseMetadata', {})
@@ -84,30 +290,55 @@ class DynamoDBUtils:
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
                 raise ValueError(f"Item with PK: {item['PK']}, SK: {item['SK']} already exists")
-            logger.error(f"Error creating item: {e}")
+            logger.error("Error creating item: %s", e)
             raise
 
-    def get_item(self, pk: str, sk: str) -> Optional[Dict[str, Any]]:
+    def get_item(self, pk: str, sk: str, consistent_read: bool = False,
+                 attributes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Retrieve an item by partition key and sort key.
 
         Args:
             pk: Partition key value.
             sk: Sort key value.
+            consistent_read: Use a strongly consistent read. Costs double the
+                read capacity but guarantees read-your-writes; leave False
+                unless staleness right after a write matters.
+            attributes: Optional list of attribute names to return. Projecting
+                just the needed fields cuts response size and deserialization
+                work on wide items.
 
         Returns:
             Dictionary containing the item data, or None if not found.
         """
+        # Strongly consistent callers want the table's answer, not a cached
+        # one; projected reads skip the cache too (it stores whole items)
+        cache_key = (f"{self.table_name}:{pk}|{sk}"
+                     if self.cache and not consistent_read and not attributes else None)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            response = self.table.get_item(
-                Key={'PK': pk, 'SK': sk}
-            )
+            get_kwargs = {
+                'TableName': self.table_name,
+                'Key': _key(pk, sk),
+                'ConsistentRead': consistent_read,
+            }
+            if attributes:
+                get_kwargs.update(_projection(attributes))
+            response = self.client.get_item(**get_kwargs)
             item = response.get('Item')
             if item:
-                logger.info(f"Retrieved item with PK: {pk}, SK: {sk}")
-            return item
+                logger.info("Retrieved item with PK: %s, SK: %s", pk, sk)
+                deserialized = _deserialize_item(item)
+                if cache_key:
+                    self.cache.set(cache_key, deserialized, self.cache_ttl)
+                return deserialized
+            return None
         except ClientError as e:
-            logger.error(f"Error retrieving item PK: {pk}, SK: {sk}: {e}")
+            logger.error("Error retrieving item PK: %s, SK: %s: %s", pk, sk, e)
             raise
 
     def update_item(self, pk: str, sk: str, updates: Dict[str, Any],
@@ -124,26 +355,35 @@ class DynamoDBUtils:
         Returns:
             Dictionary containing the updated item.
         """
-        # Prepare update expression
-        update_expression_parts = []
-        expression_attribute_names = {}
-        expression_attribute_values = {}
-
         # Add UpdatedAt timestamp
-        updates['UpdatedAt'] = datetime.utcnow().isoformat()
-
-        for key, value in updates.items():
-            attr_name = f"#{key}"
-            attr_value = f":{key}"
-            update_expression_parts.append(f"{attr_name} = {attr_value}")
-            expression_attribute_names[attr_name] = key
-            expression_attribute_values[attr_value] = value
-
-        update_expression = "SET " + ", ".join(update_expression_parts)
+        updates['UpdatedAt'] = _now_iso()
+
+        # Reuse the compiled expression + name map for this attribute set;
+        # only the values differ between calls with the same shape
+        tpl_key = frozenset(updates)
+        cached = self._update_tpl_cache.get(tpl_key)
+        if cached is None:
+            update_expression_parts = []
+            expression_attribute_names = {}
+            for key in updates:
+                update_expression_parts.append(f"#{key} = :{key}")
+                expression_attribute_names[f"#{key}"] = key
+            update_expression = "SET " + ", ".join(update_expression_parts)
+
+            if len(self._update_tpl_cache) >= 256:
+                self._update_tpl_cache.clear()
+            self._update_tpl_cache[tpl_key] = (update_expression, expression_attribute_names)
+        else:
+            update_expression, expression_attribute_names = cached
+
+        expression_attribute_values = {
+            f":{key}": _SERIALIZER.serialize(value) for key, value in updates.items()
+        }
 
         try:
             kwargs = {
-                'Key': {'PK': pk, 'SK': sk},
+                'TableName': self.table_name,
+                'Key': _key(pk, sk),
                 'UpdateExpression': update_expression,
                 'ExpressionAttributeNames': expression_attribute_names,
                 'ExpressionAttributeValues': expression_attribute_values,
@@ -153,11 +393,13 @@ class DynamoDBUtils:
             if condition_expression:
                 kwargs['ConditionExpression'] = condition_expression
 
-            response = self.table.update_item(**kwargs)
-            logger.info(f"Updated item with PK: {pk}, SK: {sk}")
-            return response['Attributes']
+            response = self.client.update_item(**kwargs)
+            logger.info("Updated item with PK: %s, SK: %s", pk, sk)
+            if self.cache:
+                self.cache.delete(f"{self.table_name}:{pk}|{sk}")
+            return _deserialize_item(response['Attributes'])
         except ClientError as e:
-            logger.error(f"Error updating item PK: {pk}, SK: {sk}: {e}")
+            logger.error("Error updating item PK: %s, SK: %s: %s", pk, sk, e)
             raise
 
     def delete_item(self, pk: str, sk: str, condition_expression: str = None) -> bool:
@@ -174,32 +416,37 @@ class DynamoDBUtils:
         """
         try:
             kwargs = {
-                'Key': {'PK': pk, 'SK': sk},
+                'TableName': self.table_name,
+                'Key': _key(pk, sk),
                 'ReturnValues': 'ALL_OLD'
             }
 
             if condition_expression:
                 kwargs['ConditionExpression'] = condition_expression
 
-            response = self.table.delete_item(**kwargs)
+            response = self.client.delete_item(**kwargs)
+            if self.cache:
+                self.cache.delete(f"{self.table_name}:{pk}|{sk}")
             deleted_item = response.get('Attributes')
 
             if deleted_item:
-                logger.info(f"Deleted item with PK: {pk}, SK: {sk}")
+                logger.info("Deleted item with PK: %s, SK: %s", pk, sk)
                 return True
             else:
-                logger.info(f"Item with PK: {pk}, SK: {sk} did not exist")
+                logger.info("Item with PK: %s, SK: %s did not exist", pk, sk)
                 return False
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                logger.warning(f"Condition failed for deleting item PK: {pk}, SK: {sk}")
+                logger.warning("Condition failed for deleting item PK: %s, SK: %s", pk, sk)
                 return False
-            logger.error(f"Error deleting item PK: {pk}, SK: {sk}: {e}")
+            logger.error("Error deleting item PK: %s, SK: %s: %s", pk, sk, e)
             raise
 
     def query_items(self, pk: str, sk_condition: str = None,
                    index_name: str = None, limit: int = None,
-                   scan_index_forward: bool = True) -> List[Dict[str, Any]]:
+                   scan_index_forward: bool = True,
+                   consistent_read: bool = False,
+                   attributes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Query items by partition key and optional sort key condition.
 
@@ -209,6 +456,10 @@ class DynamoDBUtils:
             index_name: Optional GSI name ('GSI1' or 'GSI2').
             limit: Maximum number of items to return.
             scan_index_forward: Sort order (True for ascending, False for descending).
+            consistent_read: Use strongly consistent reads. Not supported on
+                GSIs; only honored for base-table queries.
+            attributes: Optional list of attribute names to return, applied as
+                a ProjectionExpression so wide items come back trimmed.
 
         Returns:
             List of items matching the query.
@@ -227,12 +478,13 @@ class DynamoDBUtils:
 
             # Build key condition expression
             key_condition = f"{pk_name} = :pk"
-            expression_attribute_values = {':pk': pk}
+            expression_attribute_values = {':pk': {'S': pk}}
 
             if sk_condition:
                 key_condition += f" AND {sk_condition}"
 
             kwargs = {
+                'TableName': self.table_name,
                 'KeyConditionExpression': key_condition,
                 'ExpressionAttributeValues': expression_attribute_values,
                 'ScanIndexForward': scan_index_forward
@@ -240,18 +492,185 @@ class DynamoDBUtils:
 
             if index_name:
                 kwargs['IndexName'] = index_name
+            elif consistent_read:
+                # GSIs only support eventually consistent reads
+                kwargs['ConsistentRead'] = True
+
+            if attributes:
+                kwargs.update(_projection(attributes))
 
             if limit:
                 kwargs['Limit'] = limit
+                response = self.client.query(**kwargs)
+                items = [_deserialize_item(item) for item in response.get('Items', [])]
+            else:
+                # No limit: paginate through every page instead of silently
+                # truncating at the 1MB response boundary
+                items = list(self._paginate('query', kwargs))
 
-            response = self.table.query(**kwargs)
-            items = response.get('Items', [])
-
-            logger.info(f"Queried {len(items)} items with PK: {pk}")
+            logger.info("Queried %d items with PK: %s", len(items), pk)
             return items
         except ClientError as e:
-            logger.error(f"Error querying items with PK: {pk}: {e}")
+            logger.error("Error querying items with PK: %s: %s", pk, e)
+            raise
+
+    def query_page(self, pk: str, sk_condition: str = None,
+                   index_name: str = None, limit: int = 100,
+                   start_key: Optional[Dict[str, Any]] = None,
+                   scan_index_forward: bool = True,
+                   attributes: Optional[List[str]] = None
+                   ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Fetch one bounded page of query results plus the resume key.
+
+        Unlike query_items, this never reads past `limit` items: callers pass
+        the returned LastEvaluatedKey back as `start_key` to resume, which
+        keeps memory and RCU burst per call O(page) instead of O(result set).
+
+        Returns:
+            (items, last_evaluated_key) -- last_evaluated_key is None when
+            the result set is exhausted.
+        """
+        if index_name == 'GSI1':
+            pk_name = 'GSI1PK'
+        elif index_name == 'GSI2':
+            pk_name = 'GSI2PK'
+        else:
+            pk_name = 'PK'
+
+        key_condition = f"{pk_name} = :pk"
+        if sk_condition:
+            key_condition += f" AND {sk_condition}"
+
+        kwargs = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': {':pk': {'S': pk}},
+            'ScanIndexForward': scan_index_forward,
+            'Limit': limit
+        }
+        if index_name:
+            kwargs['IndexName'] = index_name
+        if attributes:
+            kwargs.update(_projection(attributes))
+        if start_key:
+            kwargs['ExclusiveStartKey'] = start_key
+
+        try:
+            response = self.client.query(**kwargs)
+        except ClientError as e:
+            logger.error("Error querying page with PK: %s: %s", pk, e)
             raise
+        items = [_deserialize_item(item) for item in response.get('Items', [])]
+        return items, response.get('LastEvaluatedKey')
+
+    def _paginate(self, operation: str, kwargs: Dict[str, Any],
+                  page_size: int = None) -> Iterator[Dict[str, Any]]:
+        """Yield deserialized items across all pages of a query/scan."""
+        paginator = self.client.get_paginator(operation)
+        if page_size:
+            kwargs = {**kwargs, 'PaginationConfig': {'PageSize': page_size}}
+        for page in paginator.paginate(**kwargs):
+            for item in page.get('Items', []):
+                yield _deserialize_item(item)
+
+    def iter_query(self, pk: str, sk_condition: str = None,
+                   index_name: str = None, scan_index_forward: bool = True,
+                   page_size: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream query results one item at a time across all result pages.
+
+        Same arguments as query_items (minus limit); memory stays bounded by
+        one page regardless of how many items match.
+        """
+        if index_name == 'GSI1':
+            pk_name = 'GSI1PK'
+        elif index_name == 'GSI2':
+            pk_name = 'GSI2PK'
+        else:
+            pk_name = 'PK'
+
+        key_condition = f"{pk_name} = :pk"
+        if sk_condition:
+            key_condition += f" AND {sk_condition}"
+
+        kwargs = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': {':pk': {'S': pk}},
+            'ScanIndexForward': scan_index_forward
+        }
+        if index_name:
+            kwargs['IndexName'] = index_name
+
+        return self._paginate('query', kwargs, page_size=page_size)
+
+    def iter_query_prefetch(self, pk: str, sk_condition: str = None,
+                            index_name: str = None, scan_index_forward: bool = True,
+                            page_size: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Like iter_query, but fetches the next page in the background while the
+        caller is still processing the current one.
+
+        When per-item processing takes about as long as a page round trip,
+        this hides the pagination latency entirely. Lookahead is one page, so
+        memory stays bounded at two pages.
+        """
+        if index_name == 'GSI1':
+            pk_name = 'GSI1PK'
+        elif index_name == 'GSI2':
+            pk_name = 'GSI2PK'
+        else:
+            pk_name = 'PK'
+
+        key_condition = f"{pk_name} = :pk"
+        if sk_condition:
+            key_condition += f" AND {sk_condition}"
+
+        kwargs = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': {':pk': {'S': pk}},
+            'ScanIndexForward': scan_index_forward
+        }
+        if index_name:
+            kwargs['IndexName'] = index_name
+        if page_size:
+            kwargs['Limit'] = page_size
+
+        def fetch(start_key):
+            if start_key:
+                return self.client.query(**kwargs, ExclusiveStartKey=start_key)
+            return self.client.query(**kwargs)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, None)
+            while future is not None:
+                response = future.result()
+
+                # Kick off the next page before yielding this one
+                next_key = response.get('LastEvaluatedKey')
+                future = executor.submit(fetch, next_key) if next_key else None
+
+                for item in response.get('Items', []):
+                    yield _deserialize_item(item)
+
+    def iter_scan(self, filter_expression: str = None,
+                  index_name: str = None,
+                  page_size: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream scan results one item at a time across all result pages.
+
+        Use this instead of scan_items for large tables: scan_items without a
+        limit materializes the full result in memory.
+        """
+        kwargs = {'TableName': self.table_name}
+        if filter_expression:
+            kwargs['FilterExpression'] = filter_expression
+        if index_name:
+            kwargs['IndexName'] = index_name
+
+        return self._paginate('scan', kwargs, page_size=page_size)
 
     def scan_items(self, filter_expression: str = None, limit: int = None,
                   index_name: str = None) -> List[Dict[str, Any]]:
@@ -270,32 +689,38 @@ class DynamoDBUtils:
             Use with caution on large tables as this operation can be expensive.
         """
         try:
-            kwargs = {}
-
-            if filter_expression:
-                kwargs['FilterExpression'] = filter_expression
-
             if limit:
-                kwargs['Limit'] = limit
-
-            if index_name:
-                kwargs['IndexName'] = index_name
-
-            response = self.table.scan(**kwargs)
-            items = response.get('Items', [])
+                kwargs = {'TableName': self.table_name, 'Limit': limit}
+                if filter_expression:
+                    kwargs['FilterExpression'] = filter_expression
+                if index_name:
+                    kwargs['IndexName'] = index_name
+
+                response = self.client.scan(**kwargs)
+                items = [_deserialize_item(item) for item in response.get('Items', [])]
+            else:
+                # No limit means the caller wants everything, so walk all
+                # pages rather than stopping at the first 1MB response
+                items = list(self.iter_scan(filter_expression=filter_expression,
+                                            index_name=index_name))
 
-            logger.info(f"Scanned {len(items)} items")
+            logger.info("Scanned %d items", len(items))
             return items
         except ClientError as e:
-            logger.error(f"Error scanning table: {e}")
+            logger.error("Error scanning table: %s", e)
             raise
 
-    def batch_get_items(self, keys: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    def batch_get_items(self, keys: List[Dict[str, str]],
+                        consistent_read: bool = False,
+                        attributes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Batch get multiple items by their keys.
 
         Args:
             keys: List of dictionaries containing PK and SK values.
+            consistent_read: Use strongly consistent reads for every key.
+            attributes: Optional list of attribute names to return for each
+                item; on bulk fetches the projection trims every response.
 
         Returns:
             List of retrieved items.
@@ -304,37 +729,68 @@ class DynamoDBUtils:
             return []
 
         try:
-            # DynamoDB batch_get_item has a limit of 100 items per request
-            all_items = []
-
-            for i in range(0, len(keys), 100):
-                batch_keys = keys[i:i + 100]
-
-                response = self.dynamodb.batch_get_item(
-                    RequestItems={
-                        self.table_name: {
-                            'Keys': batch_keys
-                        }
-                    }
-                )
-
-                items = response.get('Responses', {}).get(self.table_name, [])
-                all_items.extend(items)
-
-                # Handle unprocessed keys
-                unprocessed = response.get('UnprocessedKeys', {})
-                while unprocessed:
-                    response = self.dynamodb.batch_get_item(RequestItems=unprocessed)
-                    items = response.get('Responses', {}).get(self.table_name, [])
-                    all_items.extend(items)
-                    unprocessed = response.get('UnprocessedKeys', {})
-
-            logger.info(f"Batch retrieved {len(all_items)} items")
+            # DynamoDB batch_get_item has a limit of 100 items per request.
+            # The chunks are independent, so fetch them concurrently instead
+            # of paying one round trip per chunk.
+            chunks = [keys[i:i + 100] for i in range(0, len(keys), 100)]
+
+            if len(chunks) == 1:
+                all_items = self._do_batch_get(chunks[0], consistent_read, attributes)
+            else:
+                all_items = []
+                with ThreadPoolExecutor(max_workers=min(16, len(chunks))) as executor:
+                    for items in executor.map(
+                            lambda chunk: self._do_batch_get(chunk, consistent_read, attributes),
+                            chunks):
+                        all_items.extend(items)
+
+            logger.info("Batch retrieved %d items", len(all_items))
             return all_items
         except ClientError as e:
-            logger.error(f"Error in batch get items: {e}")
+            logger.error("Error in batch get items: %s", e)
             raise
 
+    def _do_batch_get(self, batch_keys: List[Dict[str, str]],
+                      consistent_read: bool = False,
+                      attributes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch one <=100-key chunk, retrying UnprocessedKeys with backoff."""
+        items = []
+
+        # Straight to the client: keys are serialized once here instead of
+        # going through the resource layer's per-item marshalling pass
+        table_request = {
+            'Keys': [_key(k['PK'], k['SK']) for k in batch_keys],
+            'ConsistentRead': consistent_read
+        }
+        if attributes:
+            table_request.update(_projection(attributes))
+        response = self.client.batch_get_item(
+            RequestItems={self.table_name: table_request}
+        )
+        items.extend(_deserialize_item(item)
+                     for item in response.get('Responses', {}).get(self.table_name, []))
+
+        # Handle unprocessed keys; back off so throttled chunks don't
+        # thrash, and cap the retries like the write path -- under
+        # sustained throttling an unbounded loop pins the worker thread
+        # forever.
+        unprocessed = response.get('UnprocessedKeys', {})
+        for attempt in range(MAX_BATCH_RETRIES):
+            if not unprocessed:
+                break
+            time.sleep(min(2.0, 0.05 * 2 ** attempt) + random.uniform(0, 0.05))
+            response = self.client.batch_get_item(RequestItems=unprocessed)
+            items.extend(_deserialize_item(item)
+                         for item in response.get('Responses', {}).get(self.table_name, []))
+            unprocessed = response.get('UnprocessedKeys', {})
+
+        if unprocessed:
+            logger.warning("Giving up on %d unprocessed keys after %d retries",
+                           len(unprocessed.get(self.table_name, {}).get('Keys', [])),
+                           MAX_BATCH_RETRIES)
+
+        return items
+
     def batch_write_items(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Batch write multiple items to the table.
@@ -349,63 +805,162 @@ class DynamoDBUtils:
             return {'processed': 0, 'unprocessed': []}
 
         # Add metadata to items
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = _now_iso()
         items_with_metadata = []
 
         for item in items:
             if 'PK' not in item or 'SK' not in item:
                 raise ValueError("All items must contain both 'PK' and 'SK' keys")
 
-            item_with_metadata = {
-                **item,
-                'CreatedAt': item.get('CreatedAt', timestamp),
-                'UpdatedAt': timestamp,
-                'ItemId': item.get('ItemId', str(uuid.uuid4()))
-            }
+            # setdefault only generates the UUID/timestamp fallbacks when the
+            # field is absent, and dict.copy() (or no copy at all with
+            # mutate_input) avoids rebuilding every row with {**item, ...}.
+            item_with_metadata = item if self.mutate_input else item.copy()
+            item_with_metadata.setdefault('CreatedAt', timestamp)
+            item_with_metadata['UpdatedAt'] = timestamp
+            if 'ItemId' not in item_with_metadata:
+                item_with_metadata['ItemId'] = str(uuid.uuid4())
             items_with_metadata.append(item_with_metadata)
 
+        # BatchWriteItem rejects any request containing duplicate keys, so
+        # keep only the last write per (PK, SK) -- the same dedupe that
+        # batch_writer(overwrite_by_pkeys=...) performs in aioboto3.
+        deduped = {(item['PK'], item['SK']): item for item in items_with_metadata}
+        if len(deduped) != len(items_with_metadata):
+            items_with_metadata = list(deduped.values())
+
         try:
-            processed_count = 0
+            # DynamoDB batch_write_item has a limit of 25 items per request.
+            # Chunks are independent, so write them concurrently; the optional
+            # token bucket keeps total write rate inside provisioned capacity.
+            chunks = [items_with_metadata[i:i + 25]
+                      for i in range(0, len(items_with_metadata), 25)]
+
             unprocessed_items = []
+            if len(chunks) == 1:
+                unprocessed_items.extend(self._do_batch_write(chunks[0]))
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                    for leftover in executor.map(self._do_batch_write, chunks):
+                        unprocessed_items.extend(leftover)
 
-            # DynamoDB batch_write_item has a limit of 25 items per request
-            for i in range(0, len(items_with_metadata), 25):
-                batch_items = items_with_metadata[i:i + 25]
+            processed_count = len(items_with_metadata) - len(unprocessed_items)
+            logger.info("Batch wrote %d items, %d unprocessed", processed_count, len(unprocessed_items))
 
-                request_items = {
-                    self.table_name: [
-                        {'PutRequest': {'Item': item}} for item in batch_items
-                    ]
-                }
+            return {
+                'processed': processed_count,
+                'unprocessed': unprocessed_items
+            }
+        except ClientError as e:
+            logger.error("Error in batch write items: %s", e)
+            raise
 
-                response = self.dynamodb.batch_write_item(RequestItems=request_items)
-                processed_count += len(batch_items)
+    def transact_write(self, operations: List[Dict[str, Any]]) -> None:
+        """
+        Execute up to 100 write operations as one atomic transaction.
 
-                # Handle unprocessed items
-                unprocessed = response.get('UnprocessedItems', {})
-                while unprocessed:
-                    response = self.dynamodb.batch_write_item(RequestItems=unprocessed)
-                    unprocessed = response.get('UnprocessedItems', {})
+        Args:
+            operations: List of dicts shaped like
+                {'op': 'Put', 'item': {...}}                      -- full item with PK/SK
+                {'op': 'Delete', 'pk': ..., 'sk': ...}
+                {'op': 'ConditionCheck', 'pk': ..., 'sk': ..., 'condition': ...}
+                Put and Delete also accept an optional 'condition'.
 
-                # Collect any final unprocessed items
-                if unprocessed:
-                    unprocessed_requests = unprocessed.get(self.table_name, [])
-                    for req in unprocessed_requests:
-                        if 'PutRequest' in req:
-                            unprocessed_items.append(req['PutRequest']['Item'])
+        All operations succeed or none do, in a single round trip -- use this
+        for multi-entity writes (e.g. profile + first record) instead of
+        sequential create_item calls.
 
-            logger.info(f"Batch wrote {processed_count} items, {len(unprocessed_items)} unprocessed")
+        Raises:
+            ValueError: On an unknown op or malformed operation.
+            ClientError: If the transaction is cancelled or fails.
+        """
+        timestamp = _now_iso()
+        transact_items = []
+
+        for op in operations:
+            kind = op.get('op')
+            if kind == 'Put':
+                item = op['item']
+                if 'PK' not in item or 'SK' not in item:
+                    raise ValueError("Put items must contain both 'PK' and 'SK' keys")
+                item_with_metadata = item.copy()
+                item_with_metadata.setdefault('CreatedAt', timestamp)
+                item_with_metadata['UpdatedAt'] = timestamp
+                item_with_metadata.setdefault('ItemId', str(uuid.uuid4()))
+                entry = {'TableName': self.table_name,
+                         'Item': _serialize_item(item_with_metadata)}
+                if op.get('condition'):
+                    entry['ConditionExpression'] = op['condition']
+                transact_items.append({'Put': entry})
+            elif kind == 'Delete':
+                entry = {'TableName': self.table_name,
+                         'Key': _key(op['pk'], op['sk'])}
+                if op.get('condition'):
+                    entry['ConditionExpression'] = op['condition']
+                transact_items.append({'Delete': entry})
+            elif kind == 'ConditionCheck':
+                transact_items.append({'ConditionCheck': {
+                    'TableName': self.table_name,
+                    'Key': _key(op['pk'], op['sk']),
+                    'ConditionExpression': op['condition']
+                }})
+            else:
+                raise ValueError(f"Unknown transact operation: {kind}")
 
-            return {
-                'processed': processed_count,
-                'unprocessed': unprocessed_items
-            }
+        try:
+            self.client.transact_write_items(TransactItems=transact_items)
+            logger.info("Transactionally wrote %d operations", len(transact_items))
         except ClientError as e:
-            logger.error(f"Error in batch write items: {e}")
+            logger.error("Error in transact write: %s", e)
             raise
 
+    def _do_batch_write(self, batch_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write one <=25-item chunk, retrying UnprocessedItems with backoff.
+
+        Returns any items that could not be written.
+        """
+        if self._write_limiter:
+            self._write_limiter.acquire(len(batch_items))
+
+        # Serialize each item exactly once; the resource layer used to redo
+        # this marshalling internally for every item on every attempt
+        request_items = {
+            self.table_name: [
+                {'PutRequest': {'Item': _serialize_item(item)}} for item in batch_items
+            ]
+        }
+
+        response = self.client.batch_write_item(RequestItems=request_items)
+
+        # Retrying immediately just thrashes against the same exhausted
+        # capacity, so back off exponentially with jitter between attempts.
+        # The retry count is capped: under sustained throttling an unbounded
+        # loop never terminates, so after MAX_BATCH_RETRIES the leftovers are
+        # returned to the caller instead.
+        unprocessed = response.get('UnprocessedItems', {})
+        for attempt in range(MAX_BATCH_RETRIES):
+            if not unprocessed:
+                break
+            time.sleep(min(2.0, 0.05 * 2 ** attempt) + random.uniform(0, 0.05))
+            response = self.client.batch_write_item(RequestItems=unprocessed)
+            unprocessed = response.get('UnprocessedItems', {})
+
+        if not unprocessed:
+            return []
+
+        logger.warning("Giving up on %d unprocessed writes after %d retries",
+                           len(unprocessed.get(self.table_name, [])), MAX_BATCH_RETRIES)
+        return [_deserialize_item(req['PutRequest']['Item'])
+                for req in unprocessed.get(self.table_name, [])
+                if 'PutRequest' in req]
+
 
 # Convenience functions for common patterns
+# Default-configured instances handed out by get_db_client, keyed by the
+# (table_name, region_name) pair as passed (None meaning "use env defaults")
+_INSTANCE_CACHE: Dict[tuple, DynamoDBUtils] = {}
+
+
 def get_db_client(table_name: str = None, region_name: str = None) -> DynamoDBUtils:
     """
     Get a DynamoDB utils client.
@@ -415,45 +970,109 @@ def get_db_client(table_name: str = None, region_name: str = None) -> DynamoDBUt
         region_name: Optional region name override.
 
     Returns:
-        DynamoDBUtils instance.
+        DynamoDBUtils instance. Instances are cached per (table, region), so
+        call sites that build "a client" per request all share one object and
+        its warm connection pool and template caches.
     """
-    return DynamoDBUtils(table_name=table_name, region_name=region_name)
+    key = (table_name, region_name)
+    instance = _INSTANCE_CACHE.get(key)
+    if instance is None:
+        instance = _INSTANCE_CACHE[key] = DynamoDBUtils(
+            table_name=table_name, region_name=region_name
+        )
+    return instance
 
 
 # Example usage patterns for different entity types
 class PatientRecord:
     """Helper class for patient record operations."""
 
+    # Shared key pieces, concatenated per call instead of re-formatting
+    _PK_PREFIX = 'PATIENT#'
+    _PROFILE_SK = 'PROFILE'
+
     def __init__(self, db_client: DynamoDBUtils):
         self.db = db_client
 
     def create_patient(self, patient_id: str, patient_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new patient record."""
         item = {
-            'PK': f'PATIENT#{patient_id}',
-            'SK': 'PROFILE',
+            'PK': self._PK_PREFIX + patient_id,
+            'SK': self._PROFILE_SK,
             'EntityType': 'Patient',
             'PatientId': patient_id,
             **patient_data
         }
         return self.db.create_item(item)
 
-    def get_patient(self, patient_id: str) -> Optional[Dict[str, Any]]:
-        """Get a patient by ID."""
-        return self.db.get_item(f'PATIENT#{patient_id}', 'PROFILE')
+    def get_patient(self, patient_id: str,
+                    attributes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Get a patient by ID, optionally projecting only some attributes."""
+        return self.db.get_item(self._PK_PREFIX + patient_id, self._PROFILE_SK,
+                                attributes=attributes)
+
+    def get_patients_bulk(self, patient_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get many patient profiles in one batched call.
+
+        Use this instead of looping get_patient: N profiles cost
+        ceil(N/100) BatchGetItem requests rather than N round trips.
+        """
+        return self.db.batch_get_items([
+            {'PK': self._PK_PREFIX + pid, 'SK': self._PROFILE_SK}
+            for pid in patient_ids
+        ])
+
+    def create_patient_with_initial_record(self, patient_id: str,
+                                           patient_data: Dict[str, Any],
+                                           record_data: Dict[str, Any]) -> None:
+        """Atomically create a patient profile and their first medical record.
+
+        One transactional round trip instead of two sequential create_item
+        calls, with no window where the profile exists but the record doesn't.
+        """
+        timestamp = datetime.utcnow().isoformat()
+        record_id = str(uuid.uuid4())
+        self.db.transact_write([
+            {
+                'op': 'Put',
+                'item': {
+                    'PK': self._PK_PREFIX + patient_id,
+                    'SK': self._PROFILE_SK,
+                    'EntityType': 'Patient',
+                    'PatientId': patient_id,
+                    **patient_data
+                },
+                'condition': 'attribute_not_exists(PK) AND attribute_not_exists(SK)'
+            },
+            {
+                'op': 'Put',
+                'item': {
+                    'PK': self._PK_PREFIX + patient_id,
+                    'SK': f'RECORD#{timestamp}#{record_id}',
+                    'EntityType': 'MedicalRecord',
+                    'PatientId': patient_id,
+                    'RecordId': record_id,
+                    'RecordDate': timestamp,
+                    **record_data
+                }
+            }
+        ])
 
     def update_patient(self, patient_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update a patient record."""
-        return self.db.update_item(f'PATIENT#{patient_id}', 'PROFILE', updates)
+        return self.db.update_item(self._PK_PREFIX + patient_id, self._PROFILE_SK, updates)
 
     def delete_patient(self, patient_id: str) -> bool:
         """Delete a patient record."""
-        return self.db.delete_item(f'PATIENT#{patient_id}', 'PROFILE')
+        return self.db.delete_item(self._PK_PREFIX + patient_id, self._PROFILE_SK)
 
 
 class MedicalRecord:
     """Helper class for medical record operations."""
 
+    _PK_PREFIX = 'PATIENT#'
+    _SK_PREFIX = 'RECORD#'
+
     def __init__(self, db_client: DynamoDBUtils):
         self.db = db_client
 
@@ -463,8 +1082,8 @@ class MedicalRecord:
         timestamp = datetime.utcnow().isoformat()
 
         item = {
-            'PK': f'PATIENT#{patient_id}',
-            'SK': f'RECORD#{timestamp}#{record_id}',
+            'PK': self._PK_PREFIX + patient_id,
+            'SK': self._SK_PREFIX + timestamp + '#' + record_id,
             'EntityType': 'MedicalRecord',
             'PatientId': patient_id,
             'RecordId': record_id,
@@ -475,8 +1094,16 @@ class MedicalRecord:
 
     def get_patient_records(self, patient_id: str, limit: int = None) -> List[Dict[str, Any]]:
         """Get all medical records for a patient."""
+        if limit is None:
+            # Unbounded: stream through every page so long histories are
+            # complete instead of cut off at the first response
+            return list(self.db.iter_query(
+                pk=self._PK_PREFIX + patient_id,
+                sk_condition="begins_with(SK, 'RECORD#')",
+                scan_index_forward=False  # Most recent first
+            ))
         return self.db.query_items(
-            pk=f'PATIENT#{patient_id}',
+            pk=self._PK_PREFIX + patient_id,
             sk_condition="begins_with(SK, 'RECORD#')",
             limit=limit,
             scan_index_forward=False  # Most recent first
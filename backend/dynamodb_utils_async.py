@@ -0,0 +1,180 @@
+"""
+Async mirror of the DynamoDB CRUD utilities for CareConnector.
+
+Same table layout and method names as dynamodb_utils.DynamoDBUtils, but the
+methods are coroutines built on aiobotocore, so async handlers can run
+independent operations concurrently with asyncio.gather instead of paying
+one round trip after another.
+
+Usage:
+    db = AsyncDynamoDBUtils()
+    await db.connect()          # once, for the lifetime of the app
+    item = await db.get_item('PATIENT#123', 'PROFILE')
+    ...
+    await db.close()            # on shutdown
+
+aiobotocore is an optional dependency; importing this module without it
+raises ImportError with an install hint.
+"""
+
+import asyncio
+import os
+import logging
+import random
+from contextlib import AsyncExitStack
+from typing import Dict, List, Optional, Any
+
+try:
+    from aiobotocore.session import get_session
+except ImportError as e:
+    raise ImportError(
+        "aiobotocore is required for AsyncDynamoDBUtils: pip install aiobotocore"
+    ) from e
+
+from dynamodb_utils import MAX_BATCH_RETRIES, _serialize_item, _deserialize_item, _key
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDynamoDBUtils:
+    """Async utility class for DynamoDB operations."""
+
+    def __init__(self, table_name: str = None, region_name: str = None):
+        """
+        Store configuration; the client is created by connect().
+
+        Args:
+            table_name: Name of the DynamoDB table. If None, reads from environment or uses default.
+            region_name: AWS region. If None, uses default from environment.
+        """
+        self.region_name = region_name or os.getenv('AWS_DEFAULT_REGION', 'us-east-2')
+        self.table_name = table_name or os.getenv('PATIENTS_TABLE_NAME', 'careconnector-main')
+        self._session = get_session()
+        self._stack = AsyncExitStack()
+        self.client = None
+
+    async def connect(self):
+        """Create the shared client. Call once at startup, not per request."""
+        if self.client is None:
+            self.client = await self._stack.enter_async_context(
+                self._session.create_client('dynamodb', region_name=self.region_name)
+            )
+            logger.info("Initialized async DynamoDB client for table: %s", self.table_name)
+        return self
+
+    async def close(self):
+        """Tear down the client on application shutdown."""
+        await self._stack.aclose()
+        self.client = None
+
+    async def get_item(self, pk: str, sk: str) -> Optional[Dict[str, Any]]:
+        """Retrieve an item by partition key and sort key."""
+        response = await self.client.get_item(
+            TableName=self.table_name,
+            Key=_key(pk, sk)
+        )
+        item = response.get('Item')
+        return _deserialize_item(item) if item else None
+
+    async def query_items(self, pk: str, sk_condition: str = None,
+                          index_name: str = None, limit: int = None,
+                          scan_index_forward: bool = True) -> List[Dict[str, Any]]:
+        """Query items by partition key and optional sort key condition."""
+        if index_name == 'GSI1':
+            pk_name = 'GSI1PK'
+        elif index_name == 'GSI2':
+            pk_name = 'GSI2PK'
+        else:
+            pk_name = 'PK'
+
+        key_condition = f"{pk_name} = :pk"
+        if sk_condition:
+            key_condition += f" AND {sk_condition}"
+
+        kwargs = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': {':pk': {'S': pk}},
+            'ScanIndexForward': scan_index_forward
+        }
+        if index_name:
+            kwargs['IndexName'] = index_name
+        if limit:
+            kwargs['Limit'] = limit
+
+        response = await self.client.query(**kwargs)
+        return [_deserialize_item(item) for item in response.get('Items', [])]
+
+    async def batch_get_items(self, keys: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Batch get multiple items by their keys (100 per request)."""
+        if not keys:
+            return []
+
+        all_items = []
+        for i in range(0, len(keys), 100):
+            batch_keys = [_key(k['PK'], k['SK']) for k in keys[i:i + 100]]
+            request = {self.table_name: {'Keys': batch_keys}}
+
+            response = await self.client.batch_get_item(RequestItems=request)
+            items = response.get('Responses', {}).get(self.table_name, [])
+            all_items.extend(_deserialize_item(item) for item in items)
+
+            # Same capped, jittered backoff as the sync class: retrying
+            # UnprocessedKeys immediately just thrashes the exhausted
+            # capacity that produced them, and an unbounded loop never
+            # terminates under sustained throttling.
+            request = response.get('UnprocessedKeys', {})
+            for attempt in range(MAX_BATCH_RETRIES):
+                if not request:
+                    break
+                await asyncio.sleep(min(2.0, 0.05 * 2 ** attempt) + random.uniform(0, 0.05))
+                response = await self.client.batch_get_item(RequestItems=request)
+                items = response.get('Responses', {}).get(self.table_name, [])
+                all_items.extend(_deserialize_item(item) for item in items)
+                request = response.get('UnprocessedKeys', {})
+
+            if request:
+                logger.warning("Giving up on %d unprocessed keys after %d retries",
+                               len(request.get(self.table_name, {}).get('Keys', [])),
+                               MAX_BATCH_RETRIES)
+
+        return all_items
+
+    async def batch_write_items(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Batch write multiple items to the table (25 per request)."""
+        if not items:
+            return {'processed': 0, 'unprocessed': []}
+
+        processed_count = 0
+        dropped: List[Dict[str, Any]] = []
+        for i in range(0, len(items), 25):
+            batch_items = items[i:i + 25]
+            request = {
+                self.table_name: [
+                    {'PutRequest': {'Item': _serialize_item(item)}} for item in batch_items
+                ]
+            }
+
+            response = await self.client.batch_write_item(RequestItems=request)
+
+            # Capped, jittered backoff mirroring the sync class; leftovers
+            # after MAX_BATCH_RETRIES are reported back to the caller
+            # instead of being silently dropped.
+            unprocessed = response.get('UnprocessedItems', {})
+            for attempt in range(MAX_BATCH_RETRIES):
+                if not unprocessed:
+                    break
+                await asyncio.sleep(min(2.0, 0.05 * 2 ** attempt) + random.uniform(0, 0.05))
+                response = await self.client.batch_write_item(RequestItems=unprocessed)
+                unprocessed = response.get('UnprocessedItems', {})
+
+            leftover = [_deserialize_item(req['PutRequest']['Item'])
+                        for req in unprocessed.get(self.table_name, [])
+                        if 'PutRequest' in req]
+            if leftover:
+                logger.warning("Giving up on %d unprocessed writes after %d retries",
+                               len(leftover), MAX_BATCH_RETRIES)
+                dropped.extend(leftover)
+            processed_count += len(batch_items) - len(leftover)
+
+        return {'processed': processed_count, 'unprocessed': dropped}
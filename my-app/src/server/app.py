@@ -1,21 +1,53 @@
 # app.py
+#
+# Imports here are deliberately eager. This server runs as long-lived
+# gunicorn workers, so import cost is paid once per worker -- and the gevent
+# monkey-patch in wsgi.py requires boto3/requests to be imported after it,
+# at worker start, not lazily inside handlers where the first request would
+# eat the latency. Deferring boto3 only pays off in per-invocation runtimes
+# (Lambda); the operational scripts that do care about startup time do their
+# own lazy imports.
 import os
 import sys
 import json
+import base64
 import boto3
 import logging
+import hashlib
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 
 import requests
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, g, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from jose import jwt as jose_jwt
+import jwt  # PyJWT
+from boto3.dynamodb.conditions import Attr
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from werkzeug.exceptions import BadRequest
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -27,16 +59,36 @@ logger = logging.getLogger(__name__)
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'backend'))
 try:
     from agentmail_tool import create_inbox
-    from dynamodb_utils import get_db_client, PatientRecord
+    from dynamodb_utils import get_db_client, DynamoDBUtils, PatientRecord
 except ImportError as e:
     logging.warning(f"Could not import backend tools: {e}")
     create_inbox = None
     get_db_client = None
+    DynamoDBUtils = None
     PatientRecord = None
 
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson -- C-speed encode/decode for jsonify.
+
+    Matters most for get_patients_by_agent, which can serialize hundreds of
+    profiles per response. orjson handles datetime values natively; the
+    default=str fallback covers the Decimals boto3 returns for every
+    DynamoDB number, matching how Flask's stock provider stringifies them.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS,
+                            default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Configuration
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
@@ -48,7 +100,12 @@ CORS(app, origins=os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(','))
 # Auth0 Configuration
 AUTH0_DOMAIN = os.getenv('AUTH0_DOMAIN')
 AUTH0_AUDIENCE = os.getenv('AUTH0_AUDIENCE')
-ALGORITHMS = ['RS256']
+ALGORITHMS = ('RS256',)
+
+# Fixed for the lifetime of the process; build the strings once here instead
+# of re-interpolating them inside the JWT hot path on every request
+AUTH0_ISSUER = f'https://{AUTH0_DOMAIN}/'
+AUTH0_JWKS_URL = AUTH0_ISSUER + '.well-known/jwks.json'
 
 # AWS Configuration
 AWS_REGION = os.getenv('AWS_DEFAULT_REGION', 'us-east-2')
@@ -56,14 +113,72 @@ AWS_REGION = os.getenv('AWS_DEFAULT_REGION', 'us-east-2')
 # DynamoDB Table Names
 CARECONNECTOR_TABLE = os.getenv('PATIENTS_TABLE_NAME', 'careconnector-main')
 
+# DAX (DynamoDB Accelerator) -- optional. The profile reads behind
+# get_patient_profile and the existence check in initialize_patient are
+# read-heavy single-key lookups, exactly what the DAX item cache serves in
+# microseconds instead of milliseconds. The DAX client speaks the same API,
+# so flipping the flag changes nothing else.
+USE_DAX = os.getenv('USE_DAX', '').lower() == 'true'
+DAX_ENDPOINT = os.getenv('DAX_ENDPOINT')
+
 # AgentMail Configuration
 AGENTMAIL_API_KEY = os.getenv('AGENTMAIL_API_KEY')
 AGENTMAIL_BASE_URL = os.getenv('AGENTMAIL_BASE_URL', 'https://api.agentmail.com')
 
+# Optional Redis response cache for the hot dashboard endpoints. A cache hit
+# returns stored JSON bytes straight through -- no list filtering, no
+# serialization -- and a sub-millisecond Redis GET replaces several
+# milliseconds of Flask work. Disabled unless REDIS_URL is set and the redis
+# package is installed; cache errors degrade to the uncached path.
+RESPONSE_CACHE_TTL = 60  # seconds
+_redis = None
+if redis is not None and os.getenv('REDIS_URL'):
+    try:
+        _redis = redis.Redis.from_url(os.getenv('REDIS_URL'))
+    except Exception as e:
+        logging.warning(f"Redis response cache unavailable: {e}")
+
+def _cache_get(key: str) -> Optional[bytes]:
+    if _redis is None:
+        return None
+    try:
+        return _redis.get(key)
+    except Exception:
+        return None
+
+def _cache_set(key: str, value: bytes) -> None:
+    if _redis is None:
+        return
+    try:
+        _redis.setex(key, RESPONSE_CACHE_TTL, value)
+    except Exception:
+        pass
+
+# One pooled HTTP session for all outbound calls (Auth0 JWKS, AgentMail).
+# Module-level requests.get/post opens a fresh TCP+TLS connection per call;
+# the session keeps connections warm so repeat calls skip the handshake.
+# Transient upstream errors get a couple of cheap retries with backoff.
+_HTTP = requests.Session()
+_HTTP.headers.update({'User-Agent': 'careconnector-server/1.0'})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1,
+                      status_forcelist=[429, 502, 503, 504])
+)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+# Local/dev AgentMail endpoints may be plain http; give them the same pool
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
 # Initialize DynamoDB with our sophisticated utilities
 try:
     if get_db_client and PatientRecord:
-        db_client = get_db_client(table_name=CARECONNECTOR_TABLE, region_name=AWS_REGION)
+        if USE_DAX and DAX_ENDPOINT:
+            db_client = DynamoDBUtils(table_name=CARECONNECTOR_TABLE,
+                                      region_name=AWS_REGION,
+                                      use_dax=True, dax_endpoint=DAX_ENDPOINT)
+        else:
+            db_client = get_db_client(table_name=CARECONNECTOR_TABLE, region_name=AWS_REGION)
         patient_ops = PatientRecord(db_client)
         logger.info(f"Initialized DynamoDB utilities for table: {CARECONNECTOR_TABLE}")
     else:
@@ -71,24 +186,88 @@ try:
         patient_ops = None
         logger.warning("DynamoDB utilities not available - using fallback mode")
 
-    # Fallback for legacy code compatibility
-    dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+    # Fallback for legacy code compatibility. The default botocore config
+    # caps the connection pool at 10 and uses legacy retries; under gevent
+    # workers with hundreds of greenlets that thrashes connections. Mirror
+    # the tuned config dynamodb_utils uses for its own clients.
+    dynamodb = boto3.resource(
+        'dynamodb',
+        region_name=AWS_REGION,
+        config=Config(
+            max_pool_connections=128,
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            tcp_keepalive=True,
+        ),
+    )
     patients_table = dynamodb.Table(CARECONNECTOR_TABLE)
 except Exception as e:
-    logger.error(f"Failed to initialize DynamoDB: {e}")
+    logger.error("Failed to initialize DynamoDB: %s", e)
     db_client = None
     patient_ops = None
     patients_table = None
 
-# In-memory storage for development when DynamoDB is not available
-dev_patient_profiles = {}
+# Development storage when DynamoDB is not available. A plain module dict is
+# invisible to sibling gunicorn workers, so a GET after a POST could land on
+# a worker that never saw the profile and 404. sqlite gives every worker the
+# same file-backed store with the same dict-ish access the handlers use.
+class _DevPatientStore:
+    """Process-shared dev-mode profile store backed by sqlite3."""
+
+    def __init__(self, path: str):
+        self._db = sqlite3.connect(path, check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS patients (user_id TEXT PRIMARY KEY, data TEXT)'
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _dumps(profile: Dict[str, Any]) -> str:
+        if orjson is not None:
+            return orjson.dumps(profile).decode()
+        return json.dumps(profile)
+
+    @staticmethod
+    def _loads(raw: str) -> Dict[str, Any]:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                'SELECT data FROM patients WHERE user_id = ?', (user_id,)
+            ).fetchone()
+        return self._loads(row[0]) if row else None
+
+    def __contains__(self, user_id: str) -> bool:
+        return self.get(user_id) is not None
+
+    def __getitem__(self, user_id: str) -> Dict[str, Any]:
+        profile = self.get(user_id)
+        if profile is None:
+            raise KeyError(user_id)
+        return profile
+
+    def __setitem__(self, user_id: str, profile: Dict[str, Any]) -> None:
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO patients VALUES (?, ?)',
+                (user_id, self._dumps(profile))
+            )
+
+    def items(self):
+        with self._lock:
+            rows = self._db.execute('SELECT user_id, data FROM patients').fetchall()
+        return [(user_id, self._loads(data)) for user_id, data in rows]
+
+
+# File-backed by default so every worker shares it; point DEV_DB_PATH at
+# ':memory:' for a throwaway per-process store
+dev_patient_profiles = _DevPatientStore(
+    os.getenv('DEV_DB_PATH', os.path.join(os.path.dirname(__file__), 'dev_patients.sqlite3'))
+)
 dev_appointments = {}
 dev_messages = {}
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
 # Log configuration on startup
 logger.info(f"[Startup] Auth0 Domain: {AUTH0_DOMAIN}")
 logger.info(f"[Startup] Auth0 Audience: {AUTH0_AUDIENCE}")
@@ -105,96 +284,144 @@ class AuthError(Exception):
         self.error = error
         self.status_code = status_code
 
-def get_token_auth_header() -> str:
-    """Obtains the Access Token from the Authorization Header"""
-    logger.info(f"[Auth] All request headers: {dict(request.headers)}")
+# PyJWT's JWKS client caches the key set and the constructed key objects
+# in-process, so Auth0 is only contacted on cold start, TTL expiry, or key
+# rotation (unknown kid) -- never on the per-request path. Auth0 signing
+# keys rotate rarely and an unknown kid forces a refetch anyway, so a long
+# TTL just means fewer background refreshes. The keys come back as
+# cryptography (OpenSSL) objects, so both the key construction and the
+# RS256 verification run in C.
+_jwks_client = jwt.PyJWKClient(
+    AUTH0_JWKS_URL, cache_jwk_set=True, cache_keys=True, lifespan=3600
+)
+
+# Clients reuse the same access token across many requests, but RSA
+# signature verification costs about a millisecond each time. Cache decoded
+# payloads keyed by a hash of the token (never the token itself) for a short
+# TTL capped by the token's own exp claim -- offline validation plus short
+# token lifetimes make the replayed answer exactly what decode would return.
+TOKEN_CACHE_TTL = 60  # seconds
+TOKEN_CACHE_MAX = 4096
+_token_cache: Dict[bytes, tuple] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+# Keyed hash with a process-lifetime secret: cache keys are useless outside
+# this process, so a memory dump cannot be rainbow-tabled back to tokens
+_TOKEN_CACHE_SALT = os.urandom(16)
+
+def _cache_token_payload(key: bytes, payload: Dict[str, Any]) -> None:
+    ttl = min(TOKEN_CACHE_TTL, payload.get('exp', 0) - time.time())
+    if ttl <= 0:
+        return
+    with _TOKEN_CACHE_LOCK:
+        if len(_token_cache) >= TOKEN_CACHE_MAX:
+            now = time.time()
+            expired = [k for k, v in _token_cache.items() if v[0] <= now]
+            for k in expired:
+                del _token_cache[k]
+            if len(_token_cache) >= TOKEN_CACHE_MAX:
+                _token_cache.clear()
+        _token_cache[key] = (time.time() + ttl, payload)
+
+# Missing/malformed Authorization headers are the dominant auth failure
+# modes, and they used to travel raise -> bubble -> catch -> jsonify.
+# Serialize the error bodies once; only a fresh Response wrapper is built per
+# request (Response objects cannot be shared -- flask-cors mutates their
+# headers after the handler returns).
+def _auth_error_body(code: str, description: str) -> bytes:
+    body = {'code': code, 'description': description}
+    return orjson.dumps(body) if orjson is not None else json.dumps(body).encode()
+
+_ERR_MISSING_HEADER = _auth_error_body('authorization_header_missing',
+                                       'Authorization header is expected.')
+_ERR_NOT_BEARER = _auth_error_body('invalid_header',
+                                   'Authorization header must start with "Bearer".')
+_ERR_NO_TOKEN = _auth_error_body('invalid_header', 'Token not found.')
+_ERR_BAD_BEARER = _auth_error_body('invalid_header',
+                                   'Authorization header must be bearer token.')
+
+def _auth_error(body: bytes) -> Response:
+    return Response(body, status=401, mimetype='application/json')
+
+def get_token_auth_header():
+    """Extract the access token from the Authorization header.
+
+    Returns (token, error_response); exactly one of the two is None. The
+    common failure cases return a prebuilt error body directly instead of
+    paying exception construction and a jsonify call.
+    """
+    # Header dump is debug-only: materializing the dict and formatting it on
+    # every request is wasted work when INFO is the active level, and the
+    # Authorization header (bearer token) must not end up in normal logs
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Auth] Request headers: %s", dict(request.headers))
     auth_header = request.headers.get('Authorization', None)
-    logger.info(f"[Auth] Authorization header: {auth_header}")
 
     if not auth_header:
         logger.error("[Auth] Authorization header missing!")
-        raise AuthError({
-            'code': 'authorization_header_missing',
-            'description': 'Authorization header is expected.'
-        }, 401)
+        return None, _auth_error(_ERR_MISSING_HEADER)
 
     parts = auth_header.split()
 
     if parts[0].lower() != 'bearer':
-        raise AuthError({
-            'code': 'invalid_header',
-            'description': 'Authorization header must start with "Bearer".'
-        }, 401)
+        return None, _auth_error(_ERR_NOT_BEARER)
 
     if len(parts) == 1:
-        raise AuthError({
-            'code': 'invalid_header',
-            'description': 'Token not found.'
-        }, 401)
+        return None, _auth_error(_ERR_NO_TOKEN)
 
     if len(parts) > 2:
-        raise AuthError({
-            'code': 'invalid_header',
-            'description': 'Authorization header must be bearer token.'
-        }, 401)
+        return None, _auth_error(_ERR_BAD_BEARER)
 
-    return parts[1]
+    return parts[1], None
 
 def verify_decode_jwt(token: str) -> Dict[str, Any]:
     """Verifies and decodes the JWT token"""
-    try:
-        # Get the public key from Auth0
-        jsonurl = requests.get(f'https://{AUTH0_DOMAIN}/.well-known/jwks.json')
-        jwks = jsonurl.json()
-        
-        unverified_header = jose_jwt.get_unverified_header(token)
-        rsa_key = {}
-        
-        if 'kid' not in unverified_header:
-            raise AuthError({
-                'code': 'invalid_header',
-                'description': 'Authorization malformed.'
-            }, 401)
-
-        for key in jwks['keys']:
-            if key['kid'] == unverified_header['kid']:
-                rsa_key = {
-                    'kty': key['kty'],
-                    'kid': key['kid'],
-                    'use': key['use'],
-                    'n': key['n'],
-                    'e': key['e']
-                }
-                break
+    cache_key = hashlib.blake2b(token.encode(), key=_TOKEN_CACHE_SALT,
+                                digest_size=16).digest()
+    cached = _token_cache.get(cache_key)
+    if cached and cached[0] > time.time():
+        return cached[1]
 
-        if not rsa_key:
-            raise AuthError({
-                'code': 'invalid_header',
-                'description': 'Unable to find appropriate key.'
-            }, 401)
+    try:
+        # Cached key lookup + construction inside PyJWKClient; only a cold
+        # cache or an unknown kid (key rotation) touches the network
+        signing_key = _jwks_client.get_signing_key_from_jwt(token)
 
-        payload = jose_jwt.decode(
+        payload = jwt.decode(
             token,
-            rsa_key,
+            signing_key.key,
             algorithms=ALGORITHMS,
             audience=AUTH0_AUDIENCE,
-            issuer=f'https://{AUTH0_DOMAIN}/'
+            issuer=AUTH0_ISSUER
         )
 
+        _cache_token_payload(cache_key, payload)
         return payload
 
-    except jose_jwt.ExpiredSignatureError:
+    except jwt.ExpiredSignatureError:
         raise AuthError({
             'code': 'token_expired',
             'description': 'Token expired.'
         }, 401)
 
-    except jose_jwt.JWTClaimsError:
+    except (jwt.InvalidAudienceError, jwt.InvalidIssuerError):
         raise AuthError({
             'code': 'invalid_claims',
             'description': 'Incorrect claims. Please, check the audience and issuer.'
         }, 401)
 
+    except jwt.exceptions.PyJWKClientError:
+        raise AuthError({
+            'code': 'invalid_header',
+            'description': 'Unable to find appropriate key.'
+        }, 401)
+
+    except jwt.InvalidTokenError:
+        # Any other verification failure (bad signature, malformed claims)
+        raise AuthError({
+            'code': 'invalid_token',
+            'description': 'Unable to validate token.'
+        }, 401)
+
     except Exception:
         raise AuthError({
             'code': 'invalid_header',
@@ -205,19 +432,24 @@ def requires_auth(f):
     """Decorator to require authentication"""
     @wraps(f)
     def decorated(*args, **kwargs):
-        try:
-            logger.info(f"[Auth] Processing authentication for {request.endpoint}")
-            token = get_token_auth_header()
-            logger.info(f"[Auth] Token extracted, length: {len(token) if token else 0}")
+        logger.debug("[Auth] Processing authentication for %s", request.endpoint)
+        token, header_error = get_token_auth_header()
+        if header_error is not None:
+            return header_error
 
+        try:
             payload = verify_decode_jwt(token)
-            logger.info(f"[Auth] Token decoded successfully, user: {payload.get('sub', 'unknown')}")
+            logger.debug("[Auth] Token decoded successfully, user: %s", payload.get('sub', 'unknown'))
             request.current_user = payload
+            # Stash the fields handlers actually read on g so they do one
+            # attribute read instead of re-walking the payload dict each time
+            g.user_id = payload['sub']
+            g.user_email = payload.get('email')
         except AuthError as auth_error:
-            logger.error(f"[Auth] Auth error: {auth_error.error}")
+            logger.error("[Auth] Auth error: %s", auth_error.error)
             return jsonify(auth_error.error), auth_error.status_code
         except Exception as e:
-            logger.error(f"[Auth] Authentication error: {e}")
+            logger.error("[Auth] Authentication error: %s", e)
             return jsonify({
                 'code': 'invalid_token',
                 'description': 'Unable to validate token.'
@@ -232,97 +464,354 @@ def requires_auth(f):
 def handle_auth_error(ex: AuthError):
     return jsonify(ex.error), ex.status_code
 
+# These bodies never vary, so serialize them once at import time. Only the
+# bytes are shared -- each handler wraps them in a fresh Response so
+# flask-cors can mutate headers safely.
+_NOT_FOUND_BODY = json.dumps({'success': False, 'error': 'Resource not found'}).encode()
+_BAD_REQUEST_BODY = json.dumps({'success': False, 'error': 'Bad request'}).encode()
+_SERVER_ERROR_BODY = json.dumps({'success': False, 'error': 'Internal server error'}).encode()
+
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        'success': False,
-        'error': 'Resource not found'
-    }), 404
+    return Response(_NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 @app.errorhandler(400)
 def bad_request(error):
-    return jsonify({
-        'success': False,
-        'error': 'Bad request'
-    }), 400
+    return Response(_BAD_REQUEST_BODY, status=400, mimetype='application/json')
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error'
-    }), 500
+    return Response(_SERVER_ERROR_BODY, status=500, mimetype='application/json')
+
+# UpdateExpression templates for the legacy update path, keyed by the set of
+# updated attribute names. Profile updates hit the same few field
+# combinations over and over, so the expression string and name map are
+# built once per shape; only the values vary per request.
+_UPDATE_EXPR_CACHE: Dict[frozenset, tuple] = {}
+
+def _build_update(updates: Dict[str, Any]) -> tuple:
+    """Build (UpdateExpression, names, values) for a field-update dict."""
+    shape = frozenset(updates)
+    template = _UPDATE_EXPR_CACHE.get(shape)
+    if template is None:
+        update_expression = 'SET ' + ', '.join(f'#{key} = :{key}' for key in shape)
+        expression_names = {f'#{key}': key for key in shape}
+        _UPDATE_EXPR_CACHE[shape] = template = (update_expression, expression_names)
+    update_expression, expression_names = template
+    expression_values = {f':{key}': value for key, value in updates.items()}
+    return update_expression, expression_names, expression_values
+
+# The nested profile sections are never queried inside DynamoDB -- they go
+# in and come out whole. Storing them as one JSON string attribute instead
+# of a typed M map skips the O(leaf-count) TypeSerializer/TypeDeserializer
+# walk on every read and write and shrinks the item. Opt-in via env flag
+# since it changes the stored item shape; scalar fields (user_id,
+# agent_email, GSI keys) stay native for index use either way.
+PACK_PROFILE_JSON = os.getenv('PACK_PROFILE_JSON', '').lower() == 'true'
+_PACKED_SECTIONS = ('personal_info', 'medical_info', 'preferences')
+
+def _pack_profile(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold nested profile sections into *_json string attributes."""
+    if not PACK_PROFILE_JSON:
+        return item
+    for section in _PACKED_SECTIONS:
+        if section in item:
+            value = item.pop(section)
+            item[section + '_json'] = (orjson.dumps(value).decode()
+                                       if orjson is not None else json.dumps(value))
+    return item
+
+def _unpack_profile(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Expand *_json attributes back into nested sections.
+
+    Runs regardless of the flag so items written while packing was on still
+    read correctly after it is turned off. When an item carries both
+    spellings, the native attribute wins: updates write sections natively,
+    so a surviving *_json twin is the older copy and must not clobber a
+    fresher native write after the flag is toggled.
+    """
+    if not item:
+        return item
+    for section in _PACKED_SECTIONS:
+        raw = item.pop(section + '_json', None)
+        if raw is not None and section not in item:
+            item[section] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return item
+
+def _requested_fields() -> Optional[List[str]]:
+    """Parse ?fields= into an attribute list for projection, or None for all.
+
+    Packed sections may be stored under their *_json twin, so both
+    spellings are requested; _unpack_profile resolves whichever came back.
+    """
+    fields = request.args.get('fields')
+    if not fields:
+        return None
+    attrs = [f.strip() for f in fields.split(',') if f.strip()]
+    if not attrs:
+        return None
+    attrs.extend(name + '_json' for name in _PACKED_SECTIONS if name in attrs)
+    return attrs
+
+# Required-field sets for request validation, fixed at import time
+_PERSONAL_REQ = frozenset(('date_of_birth', 'gender', 'phone', 'address'))
+_EMERGENCY_REQ = frozenset(('name', 'phone', 'relationship'))
+_MSG_REQUIRED = frozenset(('to', 'subject', 'content'))
+_NOTIF_REQUIRED = frozenset(('type', 'recipient'))
 
 # Utility Functions
+
+# Audit/log timestamps only need second resolution, so memoize the formatted
+# ISO string per wall-clock second instead of paying a datetime construction
+# plus isoformat() on every call site in the request path
+_ts_cache = [0, '']
+
+def now_iso() -> str:
+    """Current UTC time as an ISO string, cached within the same second."""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.utcfromtimestamp(t).isoformat()
+    return _ts_cache[1]
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+_BODY_UNSET = object()
+
+def _body_json() -> Optional[Any]:
+    """Parse the JSON request body, bypassing Flask's stdlib-json path.
+
+    request.get_json() decodes through the standard json module and caches an
+    intermediate copy; reading the raw bytes once and handing them to orjson
+    keeps both JSON directions of a request in C. Falls back to stdlib json
+    when orjson is not installed. The parsed body is memoized on flask.g so
+    a handler (or anything it calls) can re-read it without re-parsing --
+    get_data(cache=False) consumes the stream, so this also makes repeat
+    calls safe.
+    """
+    body = g.get('_body_json', _BODY_UNSET)
+    if body is not _BODY_UNSET:
+        return body
+    data = request.get_data(cache=False)
+    if not data:
+        g._body_json = None
+        return None
+    try:
+        body = orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        # Covers orjson.JSONDecodeError and json.JSONDecodeError alike
+        raise BadRequest('Request body is not valid JSON')
+    g._body_json = body
+    return body
+
 def get_current_user_id() -> str:
     """Get the current authenticated user's ID"""
-    return request.current_user['sub']
+    return g.user_id
 
 def serialize_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Any]:
     """Convert DynamoDB item to JSON serializable format"""
     if not item:
         return {}
-    
+
+    # When orjson is installed it is also the app's JSON provider, which
+    # serializes datetime values natively and falls back to default=str for
+    # the Decimals boto3 returns for DynamoDB numbers -- no pre-pass needed
+    # at all. (Flask's stock provider covers both on the stdlib path.)
+    if orjson is not None:
+        return item
+
+    # Fast path: every write path in this app already stores timestamps as
+    # ISO strings, so items almost never contain datetime values. any() is a
+    # single C-level scan that short-circuits on the first hit, and when it
+    # finds none we return the item untouched instead of re-walking it.
+    if not any(isinstance(value, datetime) for value in item.values()):
+        return item
+
     # Handle datetime objects
     for key, value in item.items():
         if isinstance(value, datetime):
             item[key] = value.isoformat()
-    
+
     return item
 
+# uuid4() reads /dev/urandom, so every POST paid a syscall just to mint an
+# ID. A daemon thread keeps a ring of pre-generated UUIDs topped up off the
+# request path; handlers just popleft(). deque operations are atomic under
+# the GIL, so no lock is needed on the consumer side.
+_ID_POOL_SIZE = 4096
+_ID_POOL_LOW = 256
+_id_pool = deque(str(uuid.uuid4()) for _ in range(_ID_POOL_SIZE))
+_id_pool_refill = threading.Event()
+
+def _id_pool_worker() -> None:
+    while True:
+        _id_pool_refill.wait()
+        _id_pool_refill.clear()
+        while len(_id_pool) < _ID_POOL_SIZE:
+            _id_pool.append(str(uuid.uuid4()))
+
+threading.Thread(target=_id_pool_worker, daemon=True).start()
+
 def generate_id() -> str:
     """Generate a unique ID"""
-    import uuid
-    return str(uuid.uuid4())
+    try:
+        new_id = _id_pool.popleft()
+    except IndexError:
+        # Pool drained faster than the refill thread could keep up
+        new_id = str(uuid.uuid4())
+    if len(_id_pool) < _ID_POOL_LOW:
+        _id_pool_refill.set()
+    return new_id
 
 # AgentMail Integration Functions
+
+# The key never changes after startup, so build the auth headers and the
+# messages URL once instead of re-interpolating them per send
+_AGENTMAIL_HEADERS = {
+    'Authorization': f'Bearer {AGENTMAIL_API_KEY}',
+    'Content-Type': 'application/json'
+}
+_AGENTMAIL_MESSAGES_URL = f'{AGENTMAIL_BASE_URL}/v1/messages'
+
+# Email body/subject templates, parsed once at import; the handlers fill
+# them with format_map straight from the validated request payload
+_CONFIRM_TMPL = 'Your appointment for {type} on {date} at {time} has been confirmed.'
+_PROV_SUBJECT_TMPL = 'New message from patient: {subject}'
+_PROV_CONTENT_TMPL = ('You have received a new message from a patient.\n\n'
+                      'Subject: {subject}\n\nMessage: {content}')
+
+# Split timeout: 3 s to connect, 8 s for the response. A hung AgentMail
+# cluster used to pin a pool thread for the full 30 s per send.
+_AGENTMAIL_TIMEOUT = (3, 8)
+
+# Minimal circuit breaker: after _AM_FAIL_MAX consecutive failures the
+# circuit opens and sends fast-fail for _AM_RESET_AFTER seconds instead of
+# burning a pool thread per attempt against a cluster that is down. The
+# shared session's Retry adapter already handles transient 429/5xx.
+_AM_FAIL_MAX = 5
+_AM_RESET_AFTER = 30.0
+_am_failures = 0
+_am_open_until = 0.0
+_AM_LOCK = threading.Lock()
+
+def _am_record(success: bool) -> None:
+    global _am_failures, _am_open_until
+    with _AM_LOCK:
+        if success:
+            _am_failures = 0
+        else:
+            _am_failures += 1
+            if _am_failures >= _AM_FAIL_MAX:
+                _am_open_until = time.time() + _AM_RESET_AFTER
+                logger.error("AgentMail circuit open for %.0fs after %d failures",
+                             _AM_RESET_AFTER, _am_failures)
+
 def send_agentmail_message(to_email: str, subject: str, content: str, template_id: Optional[str] = None) -> bool:
     """Send email via AgentMail API"""
     if not AGENTMAIL_API_KEY:
         logger.warning("AgentMail API key not configured")
         return False
-    
+
+    if time.time() < _am_open_until:
+        logger.warning("AgentMail circuit open, dropping send to %s", to_email)
+        return False
+
     try:
-        headers = {
-            'Authorization': f'Bearer {AGENTMAIL_API_KEY}',
-            'Content-Type': 'application/json'
-        }
-        
         payload = {
             'to': to_email,
             'subject': subject,
             'content': content,
             'template_id': template_id
         }
-        
-        response = requests.post(
-            f'{AGENTMAIL_BASE_URL}/v1/messages',
-            headers=headers,
+
+        response = _HTTP.post(
+            _AGENTMAIL_MESSAGES_URL,
+            headers=_AGENTMAIL_HEADERS,
             json=payload,
-            timeout=30
+            timeout=_AGENTMAIL_TIMEOUT
         )
-        
+
         if response.status_code == 200:
             logger.info(f"Email sent successfully to {to_email}")
+            _am_record(True)
             return True
         else:
-            logger.error(f"Failed to send email: {response.status_code} - {response.text}")
+            logger.error("Failed to send email: %s - %s", response.status_code, response.text)
+            _am_record(False)
             return False
-            
+
     except Exception as e:
-        logger.error(f"AgentMail error: {e}")
+        logger.error("AgentMail error: %s", e)
+        _am_record(False)
         return False
 
+# Pool for post-commit side effects (inbox provisioning, confirmation and
+# notification emails). All are external HTTPS calls with up to 30 s
+# timeouts; the handlers should return as soon as the write commits, not
+# wait on mail infrastructure. 16 workers keeps care-team fan-outs from
+# queueing behind each other -- the threads sit idle in socket waits, so
+# they are cheap.
+_TASK_POOL = ThreadPoolExecutor(max_workers=16)
+
+def provision_inbox(user_id: str, first_name: str, last_name: str) -> None:
+    """Create the patient's AgentMail inbox and record it on their profile."""
+    try:
+        inbox_result = create_inbox(first_name, last_name, user_id)
+        logger.info(f"Created AgentMail inbox for user {user_id}: {inbox_result}")
+        if patient_ops:
+            patient_ops.update_patient(user_id, {'agentmail_inbox': inbox_result})
+    except Exception as e:
+        logger.error("Failed to create AgentMail inbox: %s", e)
+
+def send_welcome_email(user_email: str) -> None:
+    """Send the post-signup welcome email."""
+    send_agentmail_message(
+        to_email=user_email,
+        subject='Welcome to CareConnector!',
+        content='Welcome to CareConnector! Your health profile has been successfully created. You can now schedule appointments, communicate with providers, and manage your healthcare all in one place.',
+        template_id='welcome_template'
+    )
+
 # API Routes
 
+# Static/mock payloads are serialized once at import time; the handlers hand
+# back prebuilt bytes instead of rebuilding identical dicts and re-running
+# json.dumps per request. Only the health timestamp varies, so it is the one
+# thing formatted per call.
+_HEALTH_BODY_TEMPLATE = '{{"status": "healthy", "timestamp": "{ts}", "version": "1.0.0"}}'
+
+_APPOINTMENTS_BODY = _dumps_bytes([
+    {
+        'id': '1',
+        'provider_name': 'Dr. Sarah Johnson',
+        'date': '2025-10-02',
+        'time': '2:30 PM',
+        'type': 'Annual Checkup',
+        'status': 'upcoming',
+        'location': 'Main Medical Center',
+        'provider_id': 'provider-1'
+    },
+    {
+        'id': '2',
+        'provider_name': 'Dr. Michael Chen',
+        'date': '2025-10-15',
+        'time': '10:00 AM',
+        'type': 'Cardiology Consultation',
+        'status': 'upcoming',
+        'location': 'Specialty Care Building',
+        'provider_id': 'provider-2'
+    }
+])
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
-        'version': '1.0.0'
-    })
+    return Response(
+        _HEALTH_BODY_TEMPLATE.format(ts=now_iso()),
+        mimetype='application/json'
+    )
 
 # User Initialization Route
 @app.route('/api/patient/initialize', methods=['POST'])
@@ -330,28 +819,12 @@ def health_check():
 def initialize_patient():
     """Initialize a basic patient record for a new user"""
     user_id = get_current_user_id()
-    user_email = request.current_user.get('email', '')
+    user_email = g.user_email or ''
     user_name = request.current_user.get('name', 'User')
 
     logger.info(f"[Initialize] Creating initial record for user: {user_id}")
 
     try:
-        # Check if user already exists
-        if patient_ops:
-            existing = patient_ops.get_patient(user_id)
-            if existing:
-                logger.info(f"[Initialize] User {user_id} already exists")
-                return jsonify({'message': 'User already initialized', 'profile': serialize_dynamodb_item(existing)})
-        elif patients_table:
-            response = patients_table.get_item(Key={'user_id': user_id})
-            if 'Item' in response:
-                logger.info(f"[Initialize] User {user_id} already exists (legacy)")
-                return jsonify({'message': 'User already initialized', 'profile': serialize_dynamodb_item(response['Item'])})
-        else:
-            if user_id in dev_patient_profiles:
-                logger.info(f"[Initialize] User {user_id} already exists (dev)")
-                return jsonify({'message': 'User already initialized', 'profile': dev_patient_profiles[user_id]})
-
         # Create minimal initial profile
         initial_data = {
             'user_id': user_id,
@@ -374,24 +847,45 @@ def initialize_patient():
             'agent_email': ''
         }
 
+        # Single conditional write instead of a GET followed by a PUT: the
+        # put either creates the profile or fails the condition check when
+        # one already exists, halving the RPCs on the first-time path and
+        # saving a wasted GET on repeat clicks.
         if patient_ops:
-            # Use sophisticated patient operations
-            result = patient_ops.create_patient(user_id, initial_data)
-            created_profile = result['item']
+            # create_patient's underlying PutItem is already conditional on
+            # the key not existing
+            try:
+                result = patient_ops.create_patient(user_id, _pack_profile(initial_data))
+                created_profile = _unpack_profile(result['item'])
+            except ValueError:
+                # create_item translates ConditionalCheckFailedException
+                # into ValueError before it reaches us
+                logger.info(f"[Initialize] User {user_id} already exists")
+                existing = _unpack_profile(patient_ops.get_patient(user_id))
+                return jsonify({'message': 'User already initialized', 'profile': serialize_dynamodb_item(existing)})
         elif patients_table:
             # Fallback to legacy table access
-            initial_data.update({
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
-            })
-            patients_table.put_item(Item=initial_data)
-            created_profile = initial_data
+            now = now_iso()
+            initial_data.update({'created_at': now, 'updated_at': now})
+            try:
+                patients_table.put_item(
+                    Item=initial_data,
+                    ConditionExpression=Attr('user_id').not_exists()
+                )
+                created_profile = initial_data
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                    logger.info(f"[Initialize] User {user_id} already exists (legacy)")
+                    response = patients_table.get_item(Key={'user_id': user_id})
+                    return jsonify({'message': 'User already initialized', 'profile': serialize_dynamodb_item(response.get('Item', {}))})
+                raise
         else:
             # Development mode
-            initial_data.update({
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
-            })
+            if user_id in dev_patient_profiles:
+                logger.info(f"[Initialize] User {user_id} already exists (dev)")
+                return jsonify({'message': 'User already initialized', 'profile': dev_patient_profiles[user_id]})
+            now = now_iso()
+            initial_data.update({'created_at': now, 'updated_at': now})
             dev_patient_profiles[user_id] = initial_data
             created_profile = initial_data
 
@@ -402,7 +896,7 @@ def initialize_patient():
         }), 201
 
     except Exception as e:
-        logger.error(f"[Initialize] Error initializing user {user_id}: {e}")
+        logger.error("[Initialize] Error initializing user %s: %s", user_id, e)
         return jsonify({'error': 'Failed to initialize user'}), 500
 
 # Patient Profile Routes
@@ -411,44 +905,47 @@ def initialize_patient():
 def get_patient_profile():
     """Get patient profile using sophisticated DynamoDB utilities"""
     user_id = get_current_user_id()
-    logger.info(f"[Profile GET] Request for user_id: {user_id}")
-    logger.info(f"[Profile GET] patient_ops available: {patient_ops is not None}")
-    logger.info(f"[Profile GET] patients_table available: {patients_table is not None}")
+    logger.debug("[Profile GET] Request for user_id: %s", user_id)
+
+    # Optional ?fields= projection: DynamoDB returns (and bills RCUs for)
+    # only the requested attributes instead of the whole profile
+    fields = _requested_fields()
 
     try:
         if patient_ops:
             # Use our sophisticated patient operations
-            logger.info(f"[Profile GET] Using patient_ops to get profile for {user_id}")
-            profile = patient_ops.get_patient(user_id)
+            profile = _unpack_profile(patient_ops.get_patient(user_id, attributes=fields))
             if profile:
-                logger.info(f"[Profile GET] Profile found for {user_id}")
                 return jsonify(serialize_dynamodb_item(profile))
             else:
-                logger.info(f"[Profile GET] No profile found for {user_id} - returning 404")
+                logger.debug("[Profile GET] No profile found for %s - returning 404", user_id)
                 return jsonify({'message': 'Patient profile not found'}), 404
 
         elif patients_table:
             # Fallback to legacy table access
-            logger.info(f"[Profile GET] Using legacy table access for {user_id}")
-            response = patients_table.get_item(Key={'user_id': user_id})
+            kwargs = {'Key': {'user_id': user_id}}
+            if fields:
+                kwargs['ProjectionExpression'] = ', '.join(f'#f{i}' for i in range(len(fields)))
+                kwargs['ExpressionAttributeNames'] = {f'#f{i}': f for i, f in enumerate(fields)}
+            response = patients_table.get_item(**kwargs)
             if 'Item' not in response:
-                logger.info(f"[Profile GET] No legacy profile found for {user_id} - returning 404")
+                logger.debug("[Profile GET] No legacy profile found for %s - returning 404", user_id)
                 return jsonify({'message': 'Patient profile not found'}), 404
             return jsonify(serialize_dynamodb_item(response['Item']))
 
         else:
             # Development mode with in-memory storage
-            logger.info(f"[Profile GET] Using dev storage for {user_id}")
-            logger.info(f"[Profile GET] Dev profiles available: {list(dev_patient_profiles.keys())}")
+            logger.debug("[Profile GET] Using dev storage for %s", user_id)
             if user_id in dev_patient_profiles:
-                logger.info(f"[Profile GET] Dev profile found for {user_id}")
-                return jsonify(dev_patient_profiles[user_id])
+                profile = dev_patient_profiles[user_id]
+                if fields:
+                    profile = {k: v for k, v in profile.items() if k in fields}
+                return jsonify(profile)
             else:
-                logger.info(f"[Profile GET] No dev profile found for {user_id} - returning 404")
                 return jsonify({'message': 'Patient profile not found'}), 404
 
     except Exception as e:
-        logger.error(f"[Profile GET] Error retrieving patient profile for {user_id}: {e}")
+        logger.error("[Profile GET] Error retrieving patient profile for %s: %s", user_id, e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/patient/profile', methods=['POST'])
@@ -458,7 +955,7 @@ def create_patient_profile():
     user_id = get_current_user_id()
 
     try:
-        data = request.get_json()
+        data = _body_json()
         if not data:
             raise BadRequest("No data provided")
 
@@ -467,12 +964,10 @@ def create_patient_profile():
             return jsonify({'error': 'Personal information is required'}), 400
 
         personal_info = data['personal_info']
-        required_personal_fields = ['date_of_birth', 'gender', 'phone', 'address']
-        missing_fields = []
 
-        for field in required_personal_fields:
-            if field not in personal_info or not personal_info[field]:
-                missing_fields.append(field)
+        # One comprehension over the frozen field set instead of a per-field
+        # append loop; .get covers both "missing" and "falsy" in one check
+        missing_fields = [f for f in _PERSONAL_REQ if not personal_info.get(f)]
 
         if missing_fields:
             return jsonify({'error': f'Missing required personal information: {", ".join(missing_fields)}'}), 400
@@ -480,12 +975,8 @@ def create_patient_profile():
         # Validate emergency contact if provided
         if 'emergency_contact' in personal_info:
             emergency_contact = personal_info['emergency_contact']
-            required_emergency_fields = ['name', 'phone', 'relationship']
-            missing_emergency_fields = []
-
-            for field in required_emergency_fields:
-                if field not in emergency_contact or not emergency_contact[field]:
-                    missing_emergency_fields.append(field)
+            missing_emergency_fields = [f for f in _EMERGENCY_REQ
+                                        if not emergency_contact.get(f)]
 
             if missing_emergency_fields:
                 return jsonify({'error': f'Missing required emergency contact information: {", ".join(missing_emergency_fields)}'}), 400
@@ -527,83 +1018,63 @@ def create_patient_profile():
             'agent_email': data.get('agent_email', ''),  # For GSI querying
         }
 
+        # Fold the GSI1 attributes into the item up front so the profile and
+        # its agent index entry land in one PutItem. A follow-up update_item
+        # just for GSI1PK/GSI1SK doubles the write RPCs and WCUs per create.
+        if data.get('agent_email'):
+            patient_data['GSI1PK'] = f'AGENT#{data["agent_email"]}'
+            patient_data['GSI1SK'] = f'PATIENT#{user_id}'
+
         logger.info(f"[Profile POST] Prepared patient data for {user_id}: {list(patient_data.keys())}")
 
         if patient_ops:
             # Use our sophisticated patient operations
-            result = patient_ops.create_patient(user_id, patient_data)
-            created_profile = result['item']
-
-            # Set up GSI fields for agent-based queries if agent_email is provided
-            if data.get('agent_email'):
-                # Update with GSI fields for agent queries
-                db_client.update_item(
-                    pk=f'PATIENT#{user_id}',
-                    sk='PROFILE',
-                    updates={
-                        'GSI1PK': f'AGENT#{data["agent_email"]}',
-                        'GSI1SK': f'PATIENT#{user_id}'
-                    }
-                )
+            result = patient_ops.create_patient(user_id, _pack_profile(patient_data))
+            created_profile = _unpack_profile(result['item'])
 
         elif patients_table:
             # Fallback to legacy table access
+            now = now_iso()
             profile_data = {
                 'user_id': user_id,
                 'personal_info': data['personal_info'],
                 'medical_info': data['medical_info'],
                 'preferences': data['preferences'],
                 'agent_email': data.get('agent_email', ''),
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
+                'created_at': now,
+                'updated_at': now
             }
             patients_table.put_item(Item=profile_data)
             created_profile = profile_data
 
         else:
             # Development mode with in-memory storage
+            now = now_iso()
             profile_data = {
                 'user_id': user_id,
                 'personal_info': data['personal_info'],
                 'medical_info': data['medical_info'],
                 'preferences': data['preferences'],
                 'agent_email': data.get('agent_email', ''),
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
+                'created_at': now,
+                'updated_at': now
             }
             dev_patient_profiles[user_id] = profile_data
             created_profile = profile_data
 
-        # Create AgentMail inbox for the patient if create_inbox is available
+        # Inbox provisioning and the welcome email are external HTTPS calls
+        # unrelated to whether the profile was created; run them in the
+        # background so the response returns as soon as DynamoDB commits.
+        # Failures are logged inside the tasks and never fail the request.
         if create_inbox:
-            try:
-                user_email = request.current_user.get('email', '')
-                user_name = request.current_user.get('name', 'Patient')
-                first_name = user_name.split(' ')[0] if user_name else 'Patient'
-                last_name = user_name.split(' ')[-1] if ' ' in user_name else 'User'
-
-                inbox_result = create_inbox(first_name, last_name, user_id)
-                logger.info(f"Created AgentMail inbox for user {user_id}: {inbox_result}")
-
-                # Update patient profile with inbox information
-                if patient_ops:
-                    patient_ops.update_patient(user_id, {
-                        'agentmail_inbox': inbox_result
-                    })
-
-            except Exception as e:
-                logger.error(f"Failed to create AgentMail inbox: {e}")
-                # Don't fail the profile creation if inbox creation fails
+            user_name = request.current_user.get('name', 'Patient')
+            first_name = user_name.split(' ')[0] if user_name else 'Patient'
+            last_name = user_name.split(' ')[-1] if ' ' in user_name else 'User'
+            _TASK_POOL.submit(provision_inbox, user_id, first_name, last_name)
 
-        # Send welcome email via AgentMail
-        user_email = request.current_user.get('email')
+        user_email = g.user_email
         if user_email:
-            send_agentmail_message(
-                to_email=user_email,
-                subject='Welcome to CareConnector!',
-                content=f'Welcome to CareConnector! Your health profile has been successfully created. You can now schedule appointments, communicate with providers, and manage your healthcare all in one place.',
-                template_id='welcome_template'
-            )
+            _TASK_POOL.submit(send_welcome_email, user_email)
 
         return jsonify({
             'message': 'Profile created successfully',
@@ -615,7 +1086,7 @@ def create_patient_profile():
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error creating patient profile: {e}")
+        logger.error("Error creating patient profile: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/patient/profile', methods=['PUT'])
@@ -625,7 +1096,7 @@ def update_patient_profile():
     user_id = get_current_user_id()
 
     try:
-        updates = request.get_json()
+        updates = _body_json()
         if not updates:
             raise BadRequest("No update data provided")
 
@@ -633,19 +1104,16 @@ def update_patient_profile():
         updates.pop('user_id', None)
 
         if patient_ops:
-            # Use our sophisticated patient operations
-            updated_profile = patient_ops.update_patient(user_id, updates)
-
-            # Handle agent_email GSI updates
+            # Keep the agent GSI entry in the same UpdateItem as the rest of
+            # the changes instead of issuing a second write RPC for it
             if 'agent_email' in updates:
-                db_client.update_item(
-                    pk=f'PATIENT#{user_id}',
-                    sk='PROFILE',
-                    updates={
-                        'GSI1PK': f'AGENT#{updates["agent_email"]}' if updates["agent_email"] else '',
-                        'GSI1SK': f'PATIENT#{user_id}' if updates["agent_email"] else ''
-                    }
-                )
+                updates['GSI1PK'] = f'AGENT#{updates["agent_email"]}' if updates["agent_email"] else ''
+                updates['GSI1SK'] = f'PATIENT#{user_id}' if updates["agent_email"] else ''
+
+            # Use our sophisticated patient operations
+            updated_profile = _unpack_profile(
+                patient_ops.update_patient(user_id, _pack_profile(updates))
+            )
 
             return jsonify({
                 'message': 'Profile updated successfully',
@@ -654,18 +1122,11 @@ def update_patient_profile():
 
         elif patients_table:
             # Fallback to legacy table access
-            updates['updated_at'] = datetime.utcnow().isoformat()
-
-            # Build update expression
-            update_expression = "SET "
-            expression_values = {}
+            updates['updated_at'] = now_iso()
 
-            for key, value in updates.items():
-                update_expression += f"#{key} = :{key}, "
-                expression_values[f":{key}"] = value
-
-            update_expression = update_expression.rstrip(', ')
-            expression_names = {f"#{key}": key for key in updates.keys()}
+            # Expression and name map come from the per-shape template
+            # cache; only the attribute values are bound per request
+            update_expression, expression_names, expression_values = _build_update(updates)
 
             patients_table.update_item(
                 Key={'user_id': user_id},
@@ -679,8 +1140,10 @@ def update_patient_profile():
         else:
             # Development mode with in-memory storage
             if user_id in dev_patient_profiles:
-                dev_patient_profiles[user_id].update(updates)
-                dev_patient_profiles[user_id]['updated_at'] = datetime.utcnow().isoformat()
+                profile = dev_patient_profiles[user_id]
+                profile.update(updates)
+                profile['updated_at'] = now_iso()
+                dev_patient_profiles[user_id] = profile
                 return jsonify({'message': 'Profile updated successfully'})
             else:
                 return jsonify({'error': 'Profile not found'}), 404
@@ -688,43 +1151,111 @@ def update_patient_profile():
     except BadRequest as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error updating patient profile: {e}")
+        logger.error("Error updating patient profile: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
+# Pagination cursors are the raw LastEvaluatedKey, base64-wrapped so they
+# survive a round trip through a query string opaquely
+def _encode_cursor(key: Dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(_dumps_bytes(key)).decode()
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode())
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        raise BadRequest('Invalid pagination cursor')
+
 # Patient by Agent Email Route (using GSI)
 @app.route('/api/patients/by-agent/<agent_email>', methods=['GET'])
 @requires_auth
 def get_patients_by_agent(agent_email):
     """Get patients assigned to a specific agent using sophisticated DynamoDB utilities with GSI"""
+    # Optional ?fields= projection, as on the profile GET; EntityType is
+    # needed for the result filter and trimmed back off before responding
+    fields = _requested_fields()
+    field_set = set(fields) if fields else None
+
+    # Optional pagination: ?limit= and ?cursor= switch the response to a
+    # {'items': [...], 'next': cursor} envelope with one bounded page per
+    # call. Without them the endpoint keeps returning the full bare list,
+    # so existing clients are untouched.
+    page_limit = request.args.get('limit', type=int)
+    cursor = request.args.get('cursor')
+    paginated = page_limit is not None or cursor is not None
+
     try:
+        next_cursor = None
         if db_client:
             # Use our sophisticated DynamoDB utilities with GSI1
-            patients = db_client.query_items(
-                pk=f'AGENT#{agent_email}',
-                index_name='GSI1'
-            )
+            if paginated:
+                patients, last_key = db_client.query_page(
+                    pk=f'AGENT#{agent_email}',
+                    index_name='GSI1',
+                    limit=min(page_limit or 100, 100),
+                    start_key=_decode_cursor(cursor) if cursor else None
+                )
+                if last_key:
+                    next_cursor = _encode_cursor(last_key)
+            else:
+                patients = db_client.query_items(
+                    pk=f'AGENT#{agent_email}',
+                    index_name='GSI1'
+                )
+
+            # If the GSI only projects keys, hydrate the full profiles in one
+            # batch_get_items call (100 keys per RPC, UnprocessedKeys handled
+            # with backoff) instead of issuing a get_item per patient.
+            if patients and 'personal_info' not in patients[0] \
+                    and 'personal_info_json' not in patients[0]:
+                keys = [{'PK': p['PK'], 'SK': p['SK']} for p in patients
+                        if 'PK' in p and 'SK' in p]
+                if keys:
+                    patients = db_client.batch_get_items(
+                        keys,
+                        attributes=fields + ['EntityType'] if fields else None
+                    )
 
             # Transform the results to match expected frontend format
             patient_profiles = []
             for patient_item in patients:
                 if patient_item.get('EntityType') == 'Patient':
-                    patient_profiles.append(serialize_dynamodb_item(patient_item))
+                    profile = serialize_dynamodb_item(_unpack_profile(patient_item))
+                    if field_set:
+                        profile = {k: v for k, v in profile.items() if k in field_set}
+                    patient_profiles.append(profile)
 
+            if paginated:
+                return jsonify({'items': patient_profiles, 'next': next_cursor})
             return jsonify(patient_profiles)
 
         elif patients_table:
             # Fallback to legacy table access with GSI
             try:
-                response = patients_table.query(
-                    IndexName='agent-email-index',
-                    KeyConditionExpression='agent_email = :agent_email',
-                    ExpressionAttributeValues={':agent_email': agent_email}
-                )
+                kwargs = {
+                    'IndexName': 'agent-email-index',
+                    'KeyConditionExpression': 'agent_email = :agent_email',
+                    'ExpressionAttributeValues': {':agent_email': agent_email}
+                }
+                if fields:
+                    kwargs['ProjectionExpression'] = ', '.join(f'#f{i}' for i in range(len(fields)))
+                    kwargs['ExpressionAttributeNames'] = {f'#f{i}': f for i, f in enumerate(fields)}
+                if paginated:
+                    kwargs['Limit'] = min(page_limit or 100, 100)
+                    if cursor:
+                        kwargs['ExclusiveStartKey'] = _decode_cursor(cursor)
+                response = patients_table.query(**kwargs)
                 patients = [serialize_dynamodb_item(item) for item in response.get('Items', [])]
+                if paginated:
+                    last_key = response.get('LastEvaluatedKey')
+                    return jsonify({
+                        'items': patients,
+                        'next': _encode_cursor(last_key) if last_key else None
+                    })
                 return jsonify(patients)
             except ClientError as e:
                 if 'ResourceNotFoundException' in str(e):
-                    logger.warning(f"GSI 'agent-email-index' not found, returning empty list")
+                    logger.warning("GSI 'agent-email-index' not found, returning empty list")
                     return jsonify([])
                 raise
 
@@ -734,10 +1265,14 @@ def get_patients_by_agent(agent_email):
             for user_id, profile in dev_patient_profiles.items():
                 if profile.get('agent_email') == agent_email:
                     agent_patients.append(profile)
+            if paginated:
+                return jsonify({'items': agent_patients, 'next': None})
             return jsonify(agent_patients)
 
+    except BadRequest as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error retrieving patients by agent: {e}")
+        logger.error("Error retrieving patients by agent: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 # Appointments Routes (simplified - mock data only)
@@ -748,32 +1283,12 @@ def get_appointments():
     user_id = get_current_user_id()
 
     try:
-        # Return mock data - appointments could be stored elsewhere or in a separate system
-        return jsonify([
-            {
-                'id': '1',
-                'provider_name': 'Dr. Sarah Johnson',
-                'date': '2025-10-02',
-                'time': '2:30 PM',
-                'type': 'Annual Checkup',
-                'status': 'upcoming',
-                'location': 'Main Medical Center',
-                'provider_id': 'provider-1'
-            },
-            {
-                'id': '2',
-                'provider_name': 'Dr. Michael Chen',
-                'date': '2025-10-15',
-                'time': '10:00 AM',
-                'type': 'Cardiology Consultation',
-                'status': 'upcoming',
-                'location': 'Specialty Care Building',
-                'provider_id': 'provider-2'
-            }
-        ])
+        # Mock data - appointments could be stored elsewhere or in a separate
+        # system. Serialized once at import time, returned as prebuilt bytes.
+        return Response(_APPOINTMENTS_BODY, mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Error retrieving appointments: {e}")
+        logger.error("Error retrieving appointments: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/appointments', methods=['POST'])
@@ -783,7 +1298,7 @@ def create_appointment():
     user_id = get_current_user_id()
 
     try:
-        data = request.get_json()
+        data = _body_json()
         if not data:
             raise BadRequest("No appointment data provided")
 
@@ -804,16 +1319,18 @@ def create_appointment():
             'status': 'upcoming',
             'location': data.get('location', ''),
             'notes': data.get('notes', ''),
-            'created_at': datetime.utcnow().isoformat()
+            'created_at': now_iso()
         }
 
-        # Send confirmation email via AgentMail
-        user_email = request.current_user.get('email')
+        # Queue the confirmation email; the appointment response should not
+        # wait on AgentMail's HTTP latency
+        user_email = g.user_email
         if user_email:
-            send_agentmail_message(
+            _TASK_POOL.submit(
+                send_agentmail_message,
                 to_email=user_email,
                 subject='Appointment Confirmation',
-                content=f'Your appointment for {data["type"]} on {data["date"]} at {data["time"]} has been confirmed.',
+                content=_CONFIRM_TMPL.format_map(data),
                 template_id='appointment_confirmation'
             )
 
@@ -825,9 +1342,97 @@ def create_appointment():
     except BadRequest as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error creating appointment: {e}")
+        logger.error("Error creating appointment: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
+# Mock payloads for the dashboard endpoints, built and serialized once at
+# import time. The handlers return the prebuilt bytes instead of
+# reconstructing identical dicts and re-encoding them per request.
+_MESSAGES = [
+    {
+        'id': '1',
+        'from': 'Dr. Sarah Johnson',
+        'subject': 'Lab Results Available',
+        'preview': 'Your recent blood work results are now available for review...',
+        'timestamp': '2025-09-27T14:30:00Z',
+        'unread': True,
+        'type': 'results'
+    },
+    {
+        'id': '2',
+        'from': 'CareFlow System',
+        'subject': 'Appointment Reminder',
+        'preview': 'This is a reminder for your upcoming appointment on October 2nd...',
+        'timestamp': '2025-09-26T09:00:00Z',
+        'unread': False,
+        'type': 'appointment'
+    }
+]
+_PROVIDERS = [
+    {
+        'provider_id': 'provider-1',
+        'name': 'Dr. Sarah Johnson',
+        'specialty': 'Family Medicine',
+        'location': 'Ann Arbor, MI',
+        'rating': 4.8,
+        'available_times': ['9:00 AM', '2:30 PM', '4:00 PM'],
+        'bio': 'Board-certified family physician with 15 years of experience.'
+    },
+    {
+        'provider_id': 'provider-2',
+        'name': 'Dr. Michael Chen',
+        'specialty': 'Cardiology',
+        'location': 'Ann Arbor, MI',
+        'rating': 4.9,
+        'available_times': ['10:00 AM', '1:00 PM', '3:30 PM'],
+        'bio': 'Cardiologist specializing in preventive heart care.'
+    }
+]
+
+_STATS = {
+    'upcoming_appointments': 2,
+    'unread_messages': 1,
+    'active_prescriptions': 3,
+    'last_visit': '2025-08-15',
+    'next_appointment': '2025-10-02'
+}
+
+_MESSAGES_JSON = _dumps_bytes(_MESSAGES)
+_PROVIDERS_JSON = _dumps_bytes(_PROVIDERS)
+_STATS_JSON = _dumps_bytes(_STATS)
+
+# Provider fields lowered once at import time so the filter path never
+# re-normalizes them per request; only the query string gets lowered
+_PROVIDERS_NORM = [
+    (p['location'].lower(), p['specialty'].lower(), p) for p in _PROVIDERS
+]
+
+def _user_has_redis_messages(user_id: str) -> bool:
+    """Whether any write-through message threads exist for this user."""
+    try:
+        return next(_redis.scan_iter(match=f'thread:{user_id}:*', count=100), None) is not None
+    except Exception as e:
+        logger.warning("Redis thread scan failed: %s", e)
+        return False
+
+def _stream_redis_messages(user_id: str):
+    """Yield the user's Redis-backed messages as a chunked JSON array."""
+    yield b'['
+    first = True
+    try:
+        for thread_key in _redis.scan_iter(match=f'thread:{user_id}:*', count=100):
+            for message_id in _redis.lrange(thread_key, 0, -1):
+                raw = _redis.hgetall(f'msg:{message_id.decode()}')
+                if not raw:
+                    continue
+                message = {k.decode(): v.decode() for k, v in raw.items()}
+                yield (b'' if first else b',') + _dumps_bytes(message)
+                first = False
+    except Exception as e:
+        # The array is already on the wire; close it valid and log
+        logger.warning("Redis message read failed mid-stream: %s", e)
+    yield b']'
+
 # Messages Routes (simplified - mock data only)
 @app.route('/api/messages', methods=['GET'])
 @requires_auth
@@ -836,30 +1441,28 @@ def get_messages():
     user_id = get_current_user_id()
 
     try:
-        # Return mock data - messages could be stored elsewhere or in a separate system
-        return jsonify([
-            {
-                'id': '1',
-                'from': 'Dr. Sarah Johnson',
-                'subject': 'Lab Results Available',
-                'preview': 'Your recent blood work results are now available for review...',
-                'timestamp': '2025-09-27T14:30:00Z',
-                'unread': True,
-                'type': 'results'
-            },
-            {
-                'id': '2',
-                'from': 'CareFlow System',
-                'subject': 'Appointment Reminder',
-                'preview': 'This is a reminder for your upcoming appointment on October 2nd...',
-                'timestamp': '2025-09-26T09:00:00Z',
-                'unread': False,
-                'type': 'appointment'
-            }
-        ])
+        # Users with Redis-persisted messages (written through by
+        # send_message) get them streamed one at a time: first byte goes out
+        # before the last message is read, and memory stays O(1) in the
+        # thread length. Everyone else keeps the prebuilt mock payload.
+        if _redis is not None and _user_has_redis_messages(user_id):
+            return Response(
+                stream_with_context(_stream_redis_messages(user_id)),
+                mimetype='application/json'
+            )
+
+        cache_key = f'messages:{user_id}'
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+
+        # Mock data, pre-serialized at import time; the cache layer stays in
+        # place for when messages move to a real per-user store
+        _cache_set(cache_key, _MESSAGES_JSON)
+        return Response(_MESSAGES_JSON, mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Error retrieving messages: {e}")
+        logger.error("Error retrieving messages: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/messages', methods=['POST'])
@@ -869,18 +1472,17 @@ def send_message():
     user_id = get_current_user_id()
 
     try:
-        data = request.get_json()
+        data = _body_json()
         if not data:
             raise BadRequest("No message data provided")
 
-        # Validate required fields
-        required_fields = ['to', 'subject', 'content']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        # Validate required fields in one C-level set difference
+        missing = _MSG_REQUIRED.difference(data)
+        if missing:
+            return jsonify({'error': f'Missing required fields: {", ".join(sorted(missing))}'}), 400
 
         message_id = generate_id()
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = now_iso()
 
         message_data = {
             'message_id': message_id,
@@ -894,13 +1496,35 @@ def send_message():
             'created_at': timestamp
         }
 
-        # Send notification email via AgentMail to provider
-        provider_email = data.get('provider_email')
-        if provider_email:
-            send_agentmail_message(
+        # Write-through to Redis when configured: the message hash, the
+        # thread index and the recipient's unread counter ship in a single
+        # pipelined round-trip instead of three. Errors degrade back to the
+        # mock (response-only) behaviour, same as the response cache.
+        if _redis is not None:
+            try:
+                with _redis.pipeline(transaction=False) as pipe:
+                    pipe.hset(f'msg:{message_id}', mapping=message_data)
+                    pipe.lpush(f'thread:{user_id}:{data["to"]}', message_id)
+                    pipe.incr(f'unread:{data["to"]}')
+                    pipe.execute()
+            except Exception as e:
+                logger.warning("Redis message write failed: %s", e)
+
+        # Queue the provider notifications instead of blocking the response.
+        # Care-team messages can fan out to several recipients; one pool
+        # submission per address lets the sends run in parallel, so fan-out
+        # latency tracks the slowest single send rather than the sum.
+        recipients = data.get('provider_emails') or [data.get('provider_email')]
+        notif_subject = _PROV_SUBJECT_TMPL.format_map(data)
+        notif_content = _PROV_CONTENT_TMPL.format_map(data)
+        for provider_email in recipients:
+            if not provider_email:
+                continue
+            _TASK_POOL.submit(
+                send_agentmail_message,
                 to_email=provider_email,
-                subject=f'New message from patient: {data["subject"]}',
-                content=f'You have received a new message from a patient.\n\nSubject: {data["subject"]}\n\nMessage: {data["content"]}',
+                subject=notif_subject,
+                content=notif_content,
                 template_id='provider_notification'
             )
 
@@ -912,7 +1536,7 @@ def send_message():
     except BadRequest as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error sending message: {e}")
+        logger.error("Error sending message: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 # Providers Routes (simplified - mock data only)
@@ -924,38 +1548,31 @@ def get_providers():
         location = request.args.get('location')
         specialty = request.args.get('specialty')
 
-        # Return mock data - providers could be stored elsewhere or in a separate system
+        # Unfiltered requests (the common dashboard case) short-circuit to
+        # the prebuilt bytes without touching the cache or filtering at all
+        if not location and not specialty:
+            return Response(_PROVIDERS_JSON, mimetype='application/json')
+
+        cache_key = f'providers:{location}:{specialty}'
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+
+        # Simple filtering for demo purposes, against the pre-lowered fields
+        location = location.lower() if location else None
+        specialty = specialty.lower() if specialty else None
         providers = [
-            {
-                'provider_id': 'provider-1',
-                'name': 'Dr. Sarah Johnson',
-                'specialty': 'Family Medicine',
-                'location': 'Ann Arbor, MI',
-                'rating': 4.8,
-                'available_times': ['9:00 AM', '2:30 PM', '4:00 PM'],
-                'bio': 'Board-certified family physician with 15 years of experience.'
-            },
-            {
-                'provider_id': 'provider-2',
-                'name': 'Dr. Michael Chen',
-                'specialty': 'Cardiology',
-                'location': 'Ann Arbor, MI',
-                'rating': 4.9,
-                'available_times': ['10:00 AM', '1:00 PM', '3:30 PM'],
-                'bio': 'Cardiologist specializing in preventive heart care.'
-            }
+            p for loc_lc, spec_lc, p in _PROVIDERS_NORM
+            if (location is None or location in loc_lc)
+            and (specialty is None or specialty in spec_lc)
         ]
 
-        # Simple filtering for demo purposes
-        if location:
-            providers = [p for p in providers if location.lower() in p['location'].lower()]
-        if specialty:
-            providers = [p for p in providers if specialty.lower() in p['specialty'].lower()]
-
-        return jsonify(providers)
+        body = _dumps_bytes(providers)
+        _cache_set(cache_key, body)
+        return Response(body, mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Error retrieving providers: {e}")
+        logger.error("Error retrieving providers: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 # Dashboard Analytics Routes
@@ -966,78 +1583,73 @@ def get_dashboard_stats():
     user_id = get_current_user_id()
     
     try:
-        # Mock data for development
-        stats = {
-            'upcoming_appointments': 2,
-            'unread_messages': 1,
-            'active_prescriptions': 3,
-            'last_visit': '2025-08-15',
-            'next_appointment': '2025-10-02'
-        }
-        
-        return jsonify(stats)
-    
+        # Mock data for development, pre-serialized at import time
+        return Response(_STATS_JSON, mimetype='application/json')
+
     except Exception as e:
-        logger.error(f"Error retrieving dashboard stats: {e}")
+        logger.error("Error retrieving dashboard stats: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
+# Notification templates, fixed at import time. MappingProxyType keeps the
+# shared table read-only so no handler can mutate it; values are
+# (subject, template_id) tuples rather than per-call dict literals.
+_NOTIFICATION_TEMPLATES = MappingProxyType({
+    'appointment_reminder': ('Appointment Reminder - CareFlow', 'appointment_reminder'),
+    'test_results': ('Test Results Available - CareFlow', 'test_results'),
+    'prescription_refill': ('Prescription Refill Reminder - CareFlow', 'prescription_refill'),
+})
+
 # AgentMail Integration Routes
 @app.route('/api/notifications/send', methods=['POST'])
 @requires_auth
 def send_notification():
     """Send notification via AgentMail"""
     try:
-        data = request.get_json()
+        data = _body_json()
         if not data:
             raise BadRequest("No notification data provided")
-        
-        required_fields = ['type', 'recipient']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
-        
-        user_email = request.current_user.get('email')
+
+        missing = _NOTIF_REQUIRED.difference(data)
+        if missing:
+            return jsonify({'error': f'Missing required fields: {", ".join(sorted(missing))}'}), 400
+
+        user_email = g.user_email
         notification_type = data['type']
-        
-        # Template-based notifications
-        templates = {
-            'appointment_reminder': {
-                'subject': 'Appointment Reminder - CareFlow',
-                'template_id': 'appointment_reminder'
-            },
-            'test_results': {
-                'subject': 'Test Results Available - CareFlow',
-                'template_id': 'test_results'
-            },
-            'prescription_refill': {
-                'subject': 'Prescription Refill Reminder - CareFlow',
-                'template_id': 'prescription_refill'
-            }
-        }
-        
-        template = templates.get(notification_type)
+
+        template = _NOTIFICATION_TEMPLATES.get(notification_type)
         if not template:
             return jsonify({'error': 'Invalid notification type'}), 400
+        subject, template_id = template
         
-        success = send_agentmail_message(
+        # Queue the send and ack with 202: mail delivery is asynchronous and
+        # its failures are logged by send_agentmail_message, so the API no
+        # longer blocks on (or reports) AgentMail latency
+        _TASK_POOL.submit(
+            send_agentmail_message,
             to_email=user_email,
-            subject=template['subject'],
+            subject=subject,
             content=data.get('content', ''),
-            template_id=template['template_id']
+            template_id=template_id
         )
-        
-        if success:
-            return jsonify({'message': 'Notification sent successfully'})
-        else:
-            return jsonify({'error': 'Failed to send notification'}), 500
+
+        return jsonify({'message': 'Notification queued'}), 202
     
     except BadRequest as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error sending notification: {e}")
+        logger.error("Error sending notification: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
+# In production `python app.py` re-execs into gunicorn with gevent workers
+# (see wsgi.py and gunicorn.conf.py, equivalent to running
+# `gunicorn -c gunicorn.conf.py wsgi:app` directly). The Werkzeug dev server
+# only runs when debug mode is on: it handles one request at a time, so a
+# single blocking AgentMail call would serialize everything else.
 if __name__ == '__main__':
+    if not app.config['DEBUG'] and os.getenv('FLASK_ENV', 'production') != 'development':
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        os.execvp('gunicorn', ['gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'])
+
     # Development server
     app.run(
         host='0.0.0.0',
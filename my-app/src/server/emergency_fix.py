@@ -7,55 +7,86 @@ This completely removes all jose packages and reinstalls the correct one.
 import subprocess
 import sys
 import os
+import tempfile
+
+# Skip pip's self-version check (an extra HTTPS round-trip to PyPI) and
+# never block on interactive prompts from automation.
+PIP_BASE = [sys.executable, '-m', 'pip', '--disable-pip-version-check', '--no-input']
 
 def run_command(cmd, description):
-    """Run a command and show results."""
+    """Run a command, streaming its output as it arrives."""
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    # Stream rather than capture_output=True: pip's verbose output echoes
+    # line by line instead of accumulating in memory, and the large bufsize
+    # batches pipe reads into a few syscalls instead of one per progress
+    # chunk.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True,
+                            bufsize=65536)
+    for line in proc.stdout:
+        print(f"  {line.rstrip()}")
+    returncode = proc.wait()
+
+    if returncode == 0:
         print("✓ Success")
-        if result.stdout:
-            print(f"Output: {result.stdout.strip()}")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed: {e}")
-        if e.stdout:
-            print(f"Stdout: {e.stdout}")
-        if e.stderr:
-            print(f"Stderr: {e.stderr}")
-        return False
+    print(f"✗ Failed (exit {returncode})")
+    return False
+
+def _jose_distributions():
+    """(name, version) pairs of installed distributions with 'jose' in the name."""
+    from importlib.metadata import distributions
+    return sorted({(d.metadata['Name'], d.version) for d in distributions()
+                   if d.metadata['Name'] and 'jose' in d.metadata['Name'].lower()})
 
 def main():
     """Emergency fix routine."""
     print("EMERGENCY JOSE PACKAGE FIX")
     print("=" * 30)
 
-    # Step 1: Show current packages
+    # Step 1: Show current packages. Reading the installed dist-info
+    # in-process replaces a full `pip list` subprocess.
     print("\n1. Current jose-related packages:")
-    subprocess.run([sys.executable, '-m', 'pip', 'list'], capture_output=False)
-
-    # Step 2: Force remove ALL jose packages
+    jose_installed = []
+    for name, version in _jose_distributions():
+        print(f"  {name}=={version}")
+        jose_installed.append(name)
+    if not jose_installed:
+        print("  (none)")
+
+    # Step 2: Force remove the jose packages that are actually installed.
+    # On the steady-state path (nothing installed) pip never forks; when
+    # there is something to remove, one pip invocation handles the whole
+    # list since pip's startup costs more than the uninstall itself. Fall
+    # back to per-package only on failure to keep error granularity.
     print("\n2. Removing ALL jose packages...")
-    jose_packages = ['jose', 'python-jose', 'python-jose[cryptography]']
-
-    for pkg in jose_packages:
-        run_command([sys.executable, '-m', 'pip', 'uninstall', '-y', pkg],
-                   f"Uninstalling {pkg}")
-
-    # Step 3: Clear pip cache
-    print("\n3. Clearing pip cache...")
-    run_command([sys.executable, '-m', 'pip', 'cache', 'purge'],
-               "Clearing pip cache")
-
-    # Step 4: Install the correct package
-    print("\n4. Installing correct python-jose...")
-    if not run_command([sys.executable, '-m', 'pip', 'install', 'python-jose==3.3.0'],
-                      "Installing python-jose==3.3.0"):
+    if not jose_installed:
+        print("  Nothing to remove")
+    elif not run_command([*PIP_BASE, 'uninstall', '-y', *jose_installed],
+                         "Uninstalling jose packages"):
+        for pkg in jose_installed:
+            run_command([*PIP_BASE, 'uninstall', '-y', pkg],
+                       f"Uninstalling {pkg}")
+
+    # Step 3: pip cache. Purging forces every reinstall to re-download and
+    # rebuild (boto3+botocore alone is tens of MB), so keep the wheel cache
+    # unless the user explicitly asks to drop it.
+    if '--purge' in sys.argv:
+        print("\n3. Clearing pip cache...")
+        run_command([*PIP_BASE, 'cache', 'purge'],
+                   "Clearing pip cache")
+    else:
+        print("\n3. Keeping pip cache (pass --purge to clear it)")
+
+    # Step 4: Install the correct JWT package (the server uses PyJWT now)
+    print("\n4. Installing PyJWT...")
+    if not run_command([*PIP_BASE, 'install', '--prefer-binary', 'PyJWT[crypto]>=2.8.0'],
+                      "Installing PyJWT[crypto]>=2.8.0"):
         print("Trying alternative installation...")
-        run_command([sys.executable, '-m', 'pip', 'install', '--no-cache-dir', 'python-jose'],
-                   "Installing python-jose (no cache)")
+        run_command([*PIP_BASE, 'install', '--no-cache-dir', 'PyJWT[crypto]'],
+                   "Installing PyJWT[crypto] (no cache)")
 
     # Step 5: Install other requirements
     print("\n5. Installing other requirements...")
@@ -67,28 +98,45 @@ def main():
         'python-dotenv>=1.0.0'
     ]
 
-    for pkg in other_packages:
-        run_command([sys.executable, '-m', 'pip', 'install', pkg],
-                   f"Installing {pkg}")
+    # Feed the list through a requirements file so pip's resolver runs
+    # once over the whole set and shares metadata for common transitive
+    # deps (urllib3, s3transfer, jmespath); fall back to per-package only
+    # on failure.
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write('\n'.join(other_packages) + '\n')
+        req_file = f.name
+    try:
+        if not run_command([*PIP_BASE, 'install',
+                            '--prefer-binary', '-r', req_file],
+                           "Installing other requirements"):
+            for pkg in other_packages:
+                run_command([*PIP_BASE, 'install', '--prefer-binary', pkg],
+                           f"Installing {pkg}")
+    finally:
+        os.unlink(req_file)
 
     # Step 6: Test import
     print("\n6. Testing import...")
     try:
-        from jose import jwt as jose_jwt
-        print("✓ jose import successful!")
+        import jwt as pyjwt
+        print("✓ PyJWT import successful!")
 
         # Test a simple operation
-        token = jose_jwt.encode({'test': 'data'}, 'secret', algorithm='HS256')
-        decoded = jose_jwt.decode(token, 'secret', algorithms=['HS256'])
-        print(f"✓ jose operations working: {decoded}")
+        token = pyjwt.encode({'test': 'data'}, 'secret', algorithm='HS256')
+        decoded = pyjwt.decode(token, 'secret', algorithms=['HS256'])
+        print(f"✓ PyJWT operations working: {decoded}")
 
     except Exception as e:
         print(f"✗ Import test failed: {e}")
         return False
 
-    print("\n7. Final package list:")
-    subprocess.run([sys.executable, '-m', 'pip', 'list', '|', 'grep', 'jose'],
-                  shell=True, capture_output=False)
+    print("\n7. Remaining jose-related packages:")
+    leftovers = _jose_distributions()
+    if leftovers:
+        for name, version in leftovers:
+            print(f"  {name}=={version}")
+    else:
+        print("  (none)")
 
     print("\nSUCCESS! Try running 'python app.py' now.")
     return True
@@ -7,6 +7,11 @@ This script helps resolve common dependency conflicts.
 import subprocess
 import sys
 import os
+import tempfile
+
+# Skip pip's self-version check (an extra HTTPS round-trip to PyPI) and
+# never block on interactive prompts from automation.
+PIP_BASE = [sys.executable, '-m', 'pip', '--disable-pip-version-check', '--no-input']
 
 def uninstall_conflicting_packages():
     """Remove conflicting jose packages."""
@@ -14,20 +19,32 @@ def uninstall_conflicting_packages():
 
     conflicting_packages = ['jose', 'python-jose[cryptography]']
 
-    for package in conflicting_packages:
-        try:
-            print(f"  Uninstalling {package}...")
-            subprocess.run([sys.executable, '-m', 'pip', 'uninstall', '-y', package],
-                         capture_output=True, check=False)
-        except Exception as e:
-            print(f"    Warning: {e}")
+    # Probe the installed dist-info first so the steady-state run (nothing
+    # to remove) never forks pip at all, and anything left uninstalls in a
+    # single pip invocation.
+    from importlib.metadata import distributions
+    installed = {d.metadata['Name'].lower() for d in distributions()
+                 if d.metadata['Name']}
+    to_remove = [p for p in conflicting_packages
+                 if p.split('[')[0].lower() in installed]
+
+    if not to_remove:
+        print("  No conflicting packages installed")
+        return
+
+    try:
+        print(f"  Uninstalling {', '.join(to_remove)}...")
+        subprocess.run([*PIP_BASE, 'uninstall', '-y', *to_remove],
+                     capture_output=True, check=False)
+    except Exception as e:
+        print(f"    Warning: {e}")
 
 def install_correct_packages():
     """Install the correct packages."""
     print("Installing correct packages...")
 
     packages = [
-        'python-jose>=3.3.0',
+        'PyJWT[crypto]>=2.8.0',
         'flask>=2.3.0',
         'flask-cors>=4.0.0',
         'boto3>=1.26.0',
@@ -36,10 +53,26 @@ def install_correct_packages():
         'python-dotenv>=1.0.0'
     ]
 
+    # Feed the whole list to pip through a requirements file so its
+    # resolver sees every constraint at once (boto3/botocore share
+    # transitive deps) instead of resolving N times; on failure, retry one
+    # at a time to find the package that actually broke.
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write('\n'.join(packages) + '\n')
+        req_file = f.name
+    try:
+        subprocess.check_call([*PIP_BASE, 'install',
+                               '--prefer-binary', '-r', req_file])
+        return True
+    except subprocess.CalledProcessError:
+        print("  Batch install failed, retrying per package...")
+    finally:
+        os.unlink(req_file)
+
     for package in packages:
         try:
             print(f"  Installing {package}...")
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
+            subprocess.check_call([*PIP_BASE, 'install', '--prefer-binary', package])
         except subprocess.CalledProcessError as e:
             print(f"    Error installing {package}: {e}")
             return False
@@ -51,10 +84,10 @@ def test_imports():
     print("Testing imports...")
 
     try:
-        from jose import jwt as jose_jwt
-        print("  jose.jwt: OK")
+        import jwt as pyjwt
+        print(f"  jwt (PyJWT): OK ({pyjwt.__version__})")
     except ImportError as e:
-        print(f"  jose.jwt: FAILED - {e}")
+        print(f"  jwt (PyJWT): FAILED - {e}")
         return False
 
     try:
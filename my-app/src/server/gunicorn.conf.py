@@ -0,0 +1,19 @@
+"""Gunicorn configuration for the CareConnector API server.
+
+gevent workers multiplex IO-bound requests (DynamoDB, AgentMail, Auth0)
+within each worker, so a slow upstream call no longer blocks unrelated
+requests the way the default sync worker does.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', 2 * multiprocessing.cpu_count() + 1))
+worker_connections = 1000
+# Worker timeout must outlast the 30 s AgentMail send timeout; keep-alive
+# sits above typical load-balancer idle timeouts (60 s) so the LB, not the
+# app, closes idle connections.
+timeout = 60
+keepalive = 65
@@ -7,24 +7,30 @@ import subprocess
 import sys
 import os
 
+# Skip pip's self-version check (an extra HTTPS round-trip to PyPI) and
+# never block on interactive prompts from automation.
+PIP_BASE = [sys.executable, '-m', 'pip', '--disable-pip-version-check', '--no-input']
+
 def run_command(cmd, description):
-    """Run a command and show results."""
+    """Run a command, streaming its output as it arrives."""
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    # Stream rather than capture_output=True so pip's output echoes line by
+    # line instead of accumulating in memory; the large bufsize batches
+    # pipe reads into a few syscalls.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True,
+                            bufsize=65536)
+    for line in proc.stdout:
+        print(f"  {line.rstrip()}")
+    returncode = proc.wait()
+
+    if returncode == 0:
         print("SUCCESS")
-        if result.stdout:
-            print(f"Output: {result.stdout.strip()}")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"FAILED: {e}")
-        if e.stdout:
-            print(f"Stdout: {e.stdout}")
-        if e.stderr:
-            print(f"Stderr: {e.stderr}")
-        return False
+    print(f"FAILED (exit {returncode})")
+    return False
 
 def main():
     """Simple fix routine."""
@@ -35,33 +41,41 @@ def main():
     print("\n1. Removing ALL jose packages...")
     jose_packages = ['jose', 'python-jose', 'python-jose[cryptography]']
 
-    for pkg in jose_packages:
-        run_command([sys.executable, '-m', 'pip', 'uninstall', '-y', pkg],
-                   f"Uninstalling {pkg}")
+    # One pip invocation for the whole list; fall back to per-package only
+    # on failure to keep error granularity
+    if not run_command([*PIP_BASE, 'uninstall', '-y', *jose_packages],
+                       "Uninstalling jose packages"):
+        for pkg in jose_packages:
+            run_command([*PIP_BASE, 'uninstall', '-y', pkg],
+                       f"Uninstalling {pkg}")
 
-    # Step 2: Clear pip cache
-    print("\n2. Clearing pip cache...")
-    run_command([sys.executable, '-m', 'pip', 'cache', 'purge'],
-               "Clearing pip cache")
+    # Step 2: pip cache. Keep the wheel cache so reinstalls hit local
+    # wheels instead of PyPI; purge only when explicitly requested.
+    if '--purge' in sys.argv:
+        print("\n2. Clearing pip cache...")
+        run_command([*PIP_BASE, 'cache', 'purge'],
+                   "Clearing pip cache")
+    else:
+        print("\n2. Keeping pip cache (pass --purge to clear it)")
 
-    # Step 3: Install the correct package
-    print("\n3. Installing correct python-jose...")
-    if not run_command([sys.executable, '-m', 'pip', 'install', 'python-jose==3.3.0'],
-                      "Installing python-jose==3.3.0"):
+    # Step 3: Install the correct JWT package (the server uses PyJWT now)
+    print("\n3. Installing PyJWT...")
+    if not run_command([*PIP_BASE, 'install', '--prefer-binary', 'PyJWT[crypto]>=2.8.0'],
+                      "Installing PyJWT[crypto]>=2.8.0"):
         print("Trying alternative installation...")
-        run_command([sys.executable, '-m', 'pip', 'install', '--no-cache-dir', 'python-jose'],
-                   "Installing python-jose (no cache)")
+        run_command([*PIP_BASE, 'install', '--no-cache-dir', 'PyJWT[crypto]'],
+                   "Installing PyJWT[crypto] (no cache)")
 
     # Step 4: Test import
     print("\n4. Testing import...")
     try:
-        from jose import jwt as jose_jwt
-        print("SUCCESS: jose import working!")
+        import jwt as pyjwt
+        print("SUCCESS: PyJWT import working!")
 
         # Test a simple operation
-        token = jose_jwt.encode({'test': 'data'}, 'secret', algorithm='HS256')
-        decoded = jose_jwt.decode(token, 'secret', algorithms=['HS256'])
-        print(f"SUCCESS: jose operations working: {decoded}")
+        token = pyjwt.encode({'test': 'data'}, 'secret', algorithm='HS256')
+        decoded = pyjwt.decode(token, 'secret', algorithms=['HS256'])
+        print(f"SUCCESS: PyJWT operations working: {decoded}")
 
     except Exception as e:
         print(f"FAILED: Import test failed: {e}")
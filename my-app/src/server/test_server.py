@@ -4,29 +4,102 @@ Minimal test server for CareConnector without authentication.
 Use this to test if the basic server functionality works.
 """
 
+import copy
 import os
 import sys
 import json
+import queue
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, matching the main server.
+
+    Routes every request.get_json/jsonify through orjson's C encoder so
+    the integration suite's small-payload round-trips spend their time on
+    the network, not in stdlib json.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS,
+                            default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app, origins=['http://localhost:3000'])
 
-# In-memory storage for testing
-test_profiles = {}
+# In-memory storage for testing: bounded LRU so load tests with many
+# distinct user ids cannot grow memory without bound, with a lock so the
+# threaded gunicorn deployment stays race-free.
+MAX_PROFILES = 1024
+test_profiles = OrderedDict()
+_profiles_lock = threading.Lock()
+
+# Validation/default constants hoisted out of the request handler; the
+# defaults are deep-copied on assignment so stored profiles never alias
+# the shared templates.
+# Hot-path prints go through a background writer thread so request
+# threads never block on the stdout lock under parallel load. Callables
+# are formatted on the writer thread, deferring expensive rendering
+# (like the pretty-printed payload dump) off the request path entirely.
+_LOG_Q = queue.SimpleQueue()
+
+def _log_writer():
+    while True:
+        item = _LOG_Q.get()
+        if callable(item):
+            item = item()
+        sys.stdout.write(item + '\n')
+
+threading.Thread(target=_log_writer, daemon=True).start()
+
+_REQUIRED_FIELDS = frozenset(('date_of_birth', 'gender', 'phone', 'address'))
+_DEFAULT_MEDICAL = {
+    'allergies': [],
+    'medications': [],
+    'conditions': [],
+    'insurance': {'provider': '', 'policy_number': ''}
+}
+_DEFAULT_PREFS = {
+    'communication_method': 'email',
+    'appointment_reminders': True,
+    'health_tips': False
+}
+
+# /api/health is hammered by the integration driver's polling and only
+# the timestamp varies, so the serialized body is prebuilt and the
+# timestamp spliced in -- no dict allocation or JSON encode per request.
+_HEALTH_PREFIX = (b'{"status":"healthy","version":"test-1.0.0",'
+                  b'"message":"Test server running without authentication",'
+                  b'"timestamp":"')
+_HEALTH_SUFFIX = b'"}'
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
-        'version': 'test-1.0.0',
-        'message': 'Test server running without authentication'
-    })
+    timestamp = datetime.utcnow().isoformat().encode()
+    return app.response_class(_HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX,
+                              mimetype='application/json')
+
+# Serialized once: the profile-miss 404 never varies, so the miss path
+# returns a constant body with zero encode work
+_PROFILE_NOT_FOUND_BODY = b'{"message":"Patient profile not found"}'
 
 @app.route('/api/patient/profile', methods=['GET'])
 def get_patient_profile():
@@ -34,10 +107,15 @@ def get_patient_profile():
     # Use a test user ID
     user_id = 'test-user-123'
 
-    if user_id in test_profiles:
-        return jsonify(test_profiles[user_id])
-    else:
-        return jsonify({'message': 'Patient profile not found'}), 404
+    with _profiles_lock:
+        profile = test_profiles.get(user_id)
+        if profile is not None:
+            test_profiles.move_to_end(user_id)
+
+    if profile is not None:
+        return jsonify(profile)
+    return app.response_class(_PROFILE_NOT_FOUND_BODY, status=404,
+                              mimetype='application/json')
 
 @app.route('/api/patient/profile', methods=['POST'])
 def create_patient_profile():
@@ -49,46 +127,45 @@ def create_patient_profile():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        print(f"[Test Server] Received profile data: {json.dumps(data, indent=2)}")
+        # Pretty-printing every payload costs more than the handler itself;
+        # only do it when debugging, and even then render it on the writer
+        # thread
+        if app.debug:
+            _LOG_Q.put_nowait(
+                lambda: f"[Test Server] Received profile data: {json.dumps(data, indent=2)}")
 
         # Validate required personal info
         if 'personal_info' not in data:
             return jsonify({'error': 'Personal information is required'}), 400
 
         personal_info = data['personal_info']
-        required_fields = ['date_of_birth', 'gender', 'phone', 'address']
-        missing_fields = []
-
-        for field in required_fields:
-            if field not in personal_info or not personal_info[field]:
-                missing_fields.append(field)
+        # One C-level set difference instead of looping per field
+        present = {field for field, value in personal_info.items() if value}
+        missing_fields = _REQUIRED_FIELDS - present
 
         if missing_fields:
-            return jsonify({'error': f'Missing required personal information: {", ".join(missing_fields)}'}), 400
+            return jsonify({'error': f'Missing required personal information: {", ".join(sorted(missing_fields))}'}), 400
 
         # Create profile with defaults
+        now = datetime.utcnow().isoformat()
         profile_data = {
             'user_id': user_id,
             'personal_info': personal_info,
-            'medical_info': data.get('medical_info', {
-                'allergies': [],
-                'medications': [],
-                'conditions': [],
-                'insurance': {'provider': '', 'policy_number': ''}
-            }),
-            'preferences': data.get('preferences', {
-                'communication_method': 'email',
-                'appointment_reminders': True,
-                'health_tips': False
-            }),
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
+            'medical_info': data.get('medical_info') or copy.deepcopy(_DEFAULT_MEDICAL),
+            'preferences': data.get('preferences') or copy.deepcopy(_DEFAULT_PREFS),
+            'created_at': now,
+            'updated_at': now
         }
 
-        # Store the profile
-        test_profiles[user_id] = profile_data
+        # Store the profile, evicting the least recently used entries once
+        # the bound is hit
+        with _profiles_lock:
+            test_profiles[user_id] = profile_data
+            test_profiles.move_to_end(user_id)
+            while len(test_profiles) > MAX_PROFILES:
+                test_profiles.popitem(last=False)
 
-        print(f"[Test Server] Created profile for {user_id}")
+        _LOG_Q.put_nowait(f"[Test Server] Created profile for {user_id}")
 
         return jsonify({
             'message': 'Profile created successfully',
@@ -109,9 +186,14 @@ def update_patient_profile():
         if not updates:
             return jsonify({'error': 'No update data provided'}), 400
 
-        if user_id in test_profiles:
-            test_profiles[user_id].update(updates)
-            test_profiles[user_id]['updated_at'] = datetime.utcnow().isoformat()
+        with _profiles_lock:
+            profile = test_profiles.get(user_id)
+            if profile is not None:
+                profile.update(updates)
+                profile['updated_at'] = datetime.utcnow().isoformat()
+                test_profiles.move_to_end(user_id)
+
+        if profile is not None:
             return jsonify({'message': 'Profile updated successfully'})
         else:
             return jsonify({'error': 'Profile not found'}), 404
@@ -123,10 +205,14 @@ def update_patient_profile():
 @app.route('/api/test/status', methods=['GET'])
 def test_status():
     """Test endpoint to show server status"""
+    with _profiles_lock:
+        stored = len(test_profiles)
+        profile_ids = list(test_profiles.keys())
+
     return jsonify({
         'server': 'Test Server (No Auth)',
-        'profiles_stored': len(test_profiles),
-        'profiles': list(test_profiles.keys()),
+        'profiles_stored': stored,
+        'profiles': profile_ids,
         'endpoints': [
             'GET /api/health',
             'GET /api/patient/profile',
@@ -153,6 +239,18 @@ if __name__ == '__main__':
     print("Frontend should connect to: http://localhost:5000")
     print("=" * 50)
 
+    if os.getenv('FLASK_ENV', 'production') != 'development':
+        # Serve through gunicorn like the real server: a single gthread
+        # worker keeps the in-memory profile store shared while 8 threads
+        # plus keep-alive let the integration suite's pooled session
+        # overlap requests instead of serializing on the Werkzeug dev
+        # server.
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        os.execvp('gunicorn', [
+            'gunicorn', '-k', 'gthread', '-w', '1', '--threads', '8',
+            '--keep-alive', '5', '--bind', '0.0.0.0:5000', 'test_server:app',
+        ])
+
     app.run(
         host='0.0.0.0',
         port=5000,
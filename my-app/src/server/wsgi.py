@@ -0,0 +1,26 @@
+"""
+Gunicorn entry point for the CareConnector API server.
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every route in app.py is IO-bound (DynamoDB RPCs, AgentMail HTTP, Auth0
+JWKS); under sync workers one slow upstream call parks a whole worker.
+gevent workers keep many requests in flight per worker instead.
+
+This is the deliberate alternative to porting the server to an asyncio
+stack (Quart + aioboto3, as in backend/dynamodb_utils_async.py): the
+monkey-patch makes the existing synchronous boto3/requests calls yield
+cooperatively without rewriting any handler, which buys the same
+"throughput scales with in-flight IO" property at zero migration cost.
+
+The monkey-patch has to happen before boto3/requests are imported so their
+sockets become cooperative, which is why this lives in its own module
+instead of app.py.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app  # noqa: E402  (import must follow the monkey-patch)